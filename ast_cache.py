@@ -0,0 +1,160 @@
+"""
+Content-addressed on-disk cache of syntax trees
+
+Trees are pickled one per file, named by a hash of the source and of the
+signature of everything the tree depends on. Files are written to a
+temporary name and renamed into place, so worker processes sharing the
+directory never read a partial tree. Reads refresh the modification time,
+which orders files for least-recently-used eviction once the directory
+outgrows its size limit. The size is counted once and then kept up to date
+by writes, other processes sharing the directory are only noticed by the
+next full count, done whenever the count passes the limit.
+
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+
+DEFAULT_MAX_SIZE = 256 * 2**20
+PROTOCOL = 5
+SUFFIX = ".pkl"
+
+
+class ASTCache(object):
+    """
+    Directory of pickled trees bounded by max_size bytes
+
+    """
+
+    def __init__(self, directory, max_size=DEFAULT_MAX_SIZE):
+        self.directory = directory
+        self.max_size = max_size
+        # approximate bytes in the directory, None until first counted
+        self.size = None
+
+    @staticmethod
+    def key(code, signature):
+        """
+        Return key of tree of code
+        :param code: str
+        :param signature: str - changes whenever trees of same code may differ
+        :return: str
+        """
+
+        digest = hashlib.sha256(signature.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(code.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def get(self, key):
+        """
+        Return cached entry or None
+        :param key: str
+        :return: object
+        """
+
+        path = self.path(key)
+        try:
+            with open(path, "rb") as file:
+                tree = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError):
+            self.remove(path)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return tree
+
+    def put(self, key, tree):
+        """
+        Store entry, failures only cost a parse later
+        :param key: str
+        :param tree: object - tree with anything kept next to it
+        """
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            descriptor, temporary = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                pickle.dump(tree, file, protocol=PROTOCOL)
+                written = file.tell()
+            os.replace(temporary, self.path(key))
+        except (OSError, pickle.PicklingError, RecursionError):
+            self.remove(temporary)
+            return
+
+        if self.size is None:
+            self.size = self.count()
+        else:
+            self.size += written
+
+        if self.size > self.max_size:
+            self.evict()
+
+    @staticmethod
+    def remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def count(self):
+        """
+        Return bytes of trees in the directory
+        :return: int
+        """
+
+        return sum(size for _, size, _ in self.entries())
+
+    def entries(self):
+        """
+        Return trees in the directory
+        :return: list - (mtime, size, path) tuples
+        """
+
+        entries = list()
+        try:
+            with os.scandir(self.directory) as scan:
+                for entry in scan:
+                    if not entry.name.endswith(SUFFIX):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            pass
+
+        return entries
+
+    def evict(self):
+        """
+        Remove least recently used trees until the directory fits max_size
+
+        """
+
+        entries = self.entries()
+        self.size = sum(size for _, size, _ in entries)
+        if self.size <= self.max_size:
+            return
+
+        for _, size, path in sorted(entries):
+            self.remove(path)
+            self.size -= size
+            if self.size <= self.max_size:
+                break
@@ -0,0 +1,406 @@
+"""
+Benchmarks for the lexer and parser
+
+Usage: python benchmark.py
+       {backends,memory,throughput,nesting,expressions,incremental,parallel,
+        pipeline,preparse}
+       [--scale N]
+
+"""
+
+import argparse
+import os
+import time
+import tracemalloc
+from functools import partial
+
+import lexical_analysis
+import semantic_analysis
+import syntax_analysis
+from lexer import BACKENDS, Lexer, read_source
+from parser import Parser
+
+
+def scaled_source(path="main.cpp", scale=100):
+    """
+    Return source file repeated scale times
+    :param path: str
+    :param scale: int
+    :return: str
+    """
+
+    source = read_source(path)
+    if not source.endswith("\n"):
+        source += "\n"
+
+    return source * scale
+
+
+def measure(function, *args):
+    """
+    Run function once and return its result with elapsed seconds
+    :return: (object, float)
+    """
+
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def bench_backends(scale):
+    """
+    Compare tokens, errors and speed of all lexer backends
+
+    """
+
+    source = scaled_source(scale=scale)
+    reference = None
+
+    for name in BACKENDS:
+        lexer = BACKENDS[name]()
+        stream, elapsed = measure(lexer.raw_input, source)
+        tokens, errors = [str(token) for token in stream], lexer.errors_list
+        if reference is None:
+            reference = tokens, errors
+
+        print(
+            "{:<8} {:>9} tokens {:>8.3f}s {:>12.0f} tokens/sec  parity: {}".format(
+                name,
+                len(tokens),
+                elapsed,
+                len(tokens) / elapsed,
+                (tokens, errors) == reference,
+            )
+        )
+
+
+def bench_throughput(scale):
+    """
+    Measure tokens/sec of every lexer backend on main.cpp
+
+    """
+
+    source = scaled_source(scale=scale)
+
+    for name in BACKENDS:
+        tokens, elapsed = measure(BACKENDS[name]().raw_input, source)
+        print(
+            "{:<8} {:>9} tokens {:>8.3f}s {:>12.0f} tokens/sec".format(
+                name, len(tokens), elapsed, len(tokens) / elapsed
+            )
+        )
+
+
+def allocated(function, *args):
+    """
+    Return result of function with bytes it kept allocated
+    :return: (object, int)
+    """
+
+    tracemalloc.start()
+    result = function(*args)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result, size
+
+
+def bench_memory(scale):
+    """
+    Compare memory of token list and TokenStream
+
+    """
+
+    source = scaled_source(scale=scale)
+    lexer = Lexer()
+
+    lexer.reset(source)
+    tokens, list_size = allocated(lambda: list(lexer.get_token()))
+    stream, stream_size = allocated(lexer.raw_input, source)
+
+    print("{} tokens".format(len(tokens)))
+    print("list of Token: {:>12} bytes".format(list_size))
+    print("TokenStream:   {:>12} bytes".format(stream_size))
+    print("ratio:         {:>12.1f}x".format(list_size / stream_size))
+
+
+def nested_source(depth):
+    """
+    Return function with depth nested blocks and parentheses inside
+    :param depth: int
+    :return: str
+    """
+
+    return "int main() {\n%s%s%s%s\n}\n" % (
+        "{" * depth,
+        "(" * depth,
+        ")" * depth,
+        "}" * depth,
+    )
+
+
+def bench_nesting(depth):
+    """
+    Parse deeply nested code, then the same code missing the last bracket
+
+    """
+
+    source = nested_source(depth)
+    tokens = Lexer().raw_input(source)
+    ast, elapsed = measure(Parser().build, tokens)
+    print("{:>9} levels {:>9} tokens {:>8.3f}s".format(depth, len(tokens), elapsed))
+
+    try:
+        Parser().build(Lexer().raw_input(source[: source.rindex("}")]))
+    except Exception as error:
+        print("unclosed: {}".format(error))
+
+
+class ReductionCounter(object):
+    """
+    PLY debug logger counting reductions of a parse
+
+    """
+
+    def __init__(self):
+        self.reductions = 0
+
+    def info(self, message, *args):
+        if message.startswith("Action : Reduce"):
+            self.reductions += 1
+
+    debug = warning = error = critical = info
+
+
+def count_nodes(tree):
+    nodes, stack = 0, [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, syntax_analysis.Node):
+            nodes += 1
+            stack.extend(node.parts)
+
+    return nodes
+
+
+def arithmetic_source(lines):
+    """
+    Return main function with lines of arithmetic initializations
+    :param lines: int
+    :return: str
+    """
+
+    line = "    int v = 1 + 2 * (3 - 4) / 5 % 6 - 7 * 8;\n"
+    return "int main()\n{\n%s    return 0;\n}\n" % (line * lines)
+
+
+def bench_expressions(lines):
+    """
+    Count reductions and AST nodes of arithmetic-heavy code, time its parse
+
+    """
+
+    source = arithmetic_source(lines)
+    parser = syntax_analysis.get_parser()
+    counter = ReductionCounter()
+    tree = parser.parse(source, lexer=lexical_analysis.new_lexer(), debug=counter)
+
+    parse = partial(syntax_analysis.build_tree, source, cache=False)
+    elapsed = min(measure(parse)[1] for _ in range(5))
+
+    print(
+        "{:>7} lines {:>9} reductions {:>9} nodes {:>8.3f}s".format(
+            lines, counter.reductions, count_nodes(tree), elapsed
+        )
+    )
+
+
+def functions_source(functions, body="    int b = a + {number};\n"):
+    """
+    Return source of functions, one string per function
+    :param functions: int
+    :param body: str - lines before the return, {number} is replaced by the
+        number of the function
+    :return: list of str
+    """
+
+    return [
+        "int f%d(int a)\n{\n%s    return 0;\n}\n" % (number, body.format(number=number))
+        for number in range(functions)
+    ]
+
+
+def bench_incremental(functions):
+    """
+    Compare full parse with incremental reparse after a one-line edit
+
+    """
+
+    parts = functions_source(functions)
+    source = "".join(parts)
+    parts[functions // 2] = parts[functions // 2].replace("+", "*")
+    edited = "".join(parts)
+
+    full = min(
+        measure(partial(syntax_analysis.build_tree, edited, cache=False))[1]
+        for _ in range(3)
+    )
+    incremental = syntax_analysis.IncrementalParser()
+    first = measure(incremental.parse, source)[1]
+    elapsed = list()
+    for _ in range(3):
+        incremental.parse(source)
+        elapsed.append(measure(incremental.parse, edited)[1])
+    one = min(
+        measure(
+            partial(syntax_analysis.build_tree, parts[functions // 2], cache=False)
+        )[1]
+        for _ in range(3)
+    )
+
+    print(
+        "{:>7} functions full {:.3f}s first {:.3f}s edit {:.4f}s "
+        "({} parsed) one function {:.4f}s".format(
+            functions, full, first, min(elapsed), incremental.parsed, one
+        )
+    )
+
+
+def bench_parallel(functions):
+    """
+    Time parse of many functions by 1, 2, 4 and all worker processes
+
+    """
+
+    source = "".join(functions_source(functions))
+    serial = min(
+        measure(partial(syntax_analysis.build_tree, source, cache=False))[1]
+        for _ in range(3)
+    )
+    print("{:>7} functions serial {:>8.3f}s".format(functions, serial))
+
+    for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        syntax_analysis.get_pool(workers)
+        elapsed = min(
+            measure(syntax_analysis.parse_parallel, source, workers)[1]
+            for _ in range(3)
+        )
+        print("{:>7} workers   {:>8.3f}s".format(workers, elapsed))
+
+
+def run_pipeline(source, stream):
+    """
+    Parse and check source, keeping no function after it is checked
+    :param source: str
+    :param stream: bool - parse functions one by one instead of all at once
+    :return: (float, float, int) - seconds to the first checked function,
+        seconds to the last one, peak of traced bytes or 0
+    """
+
+    semantic_analysis.functions.clear()
+    start, first = time.perf_counter(), None
+
+    if stream:
+        nodes = syntax_analysis.iter_functions(source)
+    else:
+        nodes = iter(syntax_analysis.build_tree(source, cache=False).parts)
+
+    for node in semantic_analysis.semantic_stream(nodes):
+        if first is None:
+            first = time.perf_counter() - start
+
+    peak = tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else 0
+    return first, time.perf_counter() - start, peak
+
+
+def bench_pipeline(functions):
+    """
+    Compare parse then check with functions streamed from parser to checks
+
+    """
+
+    source = "".join(functions_source(functions, "    int b = {number};\n"))
+
+    for name, stream in (("batch", False), ("stream", True)):
+        first, total, _ = run_pipeline(source, stream)
+        tracemalloc.start()
+        *_, peak = run_pipeline(source, stream)
+        tracemalloc.stop()
+
+        print(
+            "{:<6} first function {:>8.4f}s all {:>7.3f}s peak {:>12} bytes".format(
+                name, first, total, peak
+            )
+        )
+
+
+def bench_preparse(functions):
+    """
+    Compare full parse of functions with 20-line bodies with pre-parse
+    reading their signatures only, then their bodies
+
+    """
+
+    body = "".join("    int v%d = a + %d;\n" % (line, line) for line in range(20))
+    source = "".join(functions_source(functions, body))
+    full = min(
+        measure(partial(syntax_analysis.build_tree, source, cache=False))[1]
+        for _ in range(3)
+    )
+
+    def signatures():
+        tree = syntax_analysis.preparse(source)
+        return tree, [function.header.parts[1] for function in tree.parts]
+
+    (tree, names), elapsed = min(
+        (measure(signatures) for _ in range(3)), key=lambda result: result[1]
+    )
+    _, bodies = measure(lambda: [function.body for function in tree.parts])
+
+    print(
+        "{:>7} functions full {:.3f}s signatures {:.3f}s ({} names) "
+        "bodies on demand {:.3f}s".format(functions, full, elapsed, len(names), bodies)
+    )
+
+
+if __name__ == "__main__":
+    arguments = argparse.ArgumentParser(description=__doc__.strip())
+    arguments.add_argument(
+        "benchmark",
+        choices=[
+            "backends",
+            "memory",
+            "throughput",
+            "nesting",
+            "expressions",
+            "incremental",
+            "parallel",
+            "pipeline",
+            "preparse",
+        ],
+    )
+    arguments.add_argument(
+        "--scale",
+        type=int,
+        help="copies of main.cpp, nesting depth, lines or functions",
+    )
+    options = arguments.parse_args()
+
+    if options.benchmark == "backends":
+        bench_backends(options.scale or 100)
+    elif options.benchmark == "memory":
+        bench_memory(options.scale or 100)
+    elif options.benchmark == "throughput":
+        bench_throughput(options.scale or 10000)
+    elif options.benchmark == "nesting":
+        bench_nesting(options.scale or 10000)
+    elif options.benchmark == "expressions":
+        bench_expressions(options.scale or 2000)
+    elif options.benchmark == "incremental":
+        bench_incremental(options.scale or 5000)
+    elif options.benchmark == "parallel":
+        bench_parallel(options.scale or 20000)
+    elif options.benchmark == "pipeline":
+        bench_pipeline(options.scale or 5000)
+    elif options.benchmark == "preparse":
+        bench_preparse(options.scale or 5000)
@@ -1,25 +1,461 @@
-import copy
-from parser import Parser
-
-import texttable as tt
+import argparse
+import glob
+import os
+import re
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from parser import NodeKind, Parser
+
+from line_index import LineIndex
+from token_report import FORMATS, write_report
 
 from lexer_constants import *
 
 
+def read_source(file):
+    """
+    Read the whole source file into a single buffer
+    :param file: str - path to source file
+    :return: str
+    """
+
+    with open(file, "rb") as source:
+        text = source.read().decode("utf-8")
+
+    # same newline translation as a file opened in text mode
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+    return text
+
+
+# tokens after which lexer state depends only on the rest of the source
+RESTART_MASK = kind_mask(SEMICOLON, L_CURL, R_CURL)
+# tokens read as names, they define whether variable type is expected
+NAME_MASK = kind_mask(
+    ID, FUNC, FUNC_DECLARATION, TYPE, IF, ELSE, WHILE, FOR, BREAK, CONTINUE, RETURN
+)
+
+
+DUMP_MAGIC = b"MTOK1"
+DUMP_HEADER = struct.Struct("<5sQQ")
+
+
+# tokens located by their opening quote, which is not a part of value
+QUOTED_MASK = kind_mask(STRING, CHAR)
+
+
+def token_position(lines, tag, start):
+    """
+    Return row and column where token starts
+    :param lines: LineIndex
+    :param tag: int
+    :param start: int - offset of token value
+    :return: (int, int)
+    """
+
+    if 1 << tag & QUOTED_MASK:
+        start -= 1
+
+    return lines.position(start)
+
+
+def format_error(text, row, col):
+    return "{} in line {}, column {}".format(text, row, col)
+
+
+def number_value(lexeme):
+    """
+    Convert number lexeme with optional sign to int or float
+    :param lexeme: str
+    :return: int | float
+    """
+
+    sign = -1 if lexeme[0] == "-" else 1
+    return sign * (int(lexeme)) if "." not in lexeme else sign * (float(lexeme))
+
+
+def token_value(source, tag, start, end):
+    """
+    Decode value of token from its offsets in the source
+    :param source: str
+    :param tag: int
+    :param start: int
+    :param end: int
+    :return: str | int | float
+    """
+
+    if tag == NUMBER:
+        lexeme = source[start:end]
+        if lexeme[0] in ("-", "+"):
+            # one character after the sign is skipped by the lexer
+            lexeme = lexeme[0] + source[start + 2 : end]
+
+        return number_value(lexeme)
+
+    return source[start:end]
+
+
 class Token:
     """
     docstring for Token
 
+    Value given as None is sliced from the source on first access and
+    cached, numbers are converted only then.
+
     """
 
-    def __init__(self, value, tag, row, col):
-        self.value = value
+    __slots__ = ("_value", "tag", "start", "end", "lines", "source")
+
+    def __init__(self, value, tag, start=None, end=None, lines=None, source=None):
+        self._value = value
         self.tag = tag
-        self.row = row
-        self.col = col
+        self.start = start
+        self.end = end
+        self.lines = lines
+        self.source = source
+
+    @property
+    def value(self):
+        if self._value is None:
+            self._value = token_value(self.source, self.tag, self.start, self.end)
+
+        return self._value
+
+    @property
+    def position(self):
+        return token_position(self.lines, self.tag, self.start)
+
+    @property
+    def row(self):
+        return token_position(self.lines, self.tag, self.start)[0]
+
+    @property
+    def col(self):
+        return token_position(self.lines, self.tag, self.start)[1]
 
     def __str__(self):
-        return "<{}, {}, {}, {}>".format(self.value, self.tag, self.row, self.col)
+        return "<{}, {}, {}, {}>".format(
+            self.value,
+            KIND_NAMES.get(self.tag, self.tag),
+            *token_position(self.lines, self.tag, self.start),
+        )
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class TokenView:
+    """
+    Lightweight Token read from TokenStream columns
+
+    """
+
+    __slots__ = ("stream", "index")
+
+    def __init__(self, stream, index):
+        self.stream = stream
+        self.index = index
+
+    @property
+    def value(self):
+        return self.stream.value(self.index)
+
+    @property
+    def tag(self):
+        return KINDS[self.stream.kinds[self.index]]
+
+    @property
+    def position(self):
+        return self.stream.position(self.index)
+
+    @property
+    def row(self):
+        return self.stream.position(self.index)[0]
+
+    @property
+    def col(self):
+        return self.stream.position(self.index)[1]
+
+    @property
+    def start(self):
+        return self.stream.starts[self.index]
+
+    @property
+    def end(self):
+        return self.stream.ends[self.index]
+
+    def __str__(self):
+        return "<{}, {}, {}, {}>".format(
+            self.value,
+            KIND_NAMES.get(self.tag, self.tag),
+            *self.stream.position(self.index),
+        )
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class SymbolIndex:
+    """
+    Token indices of function declarations, type keywords and identifiers
+    by their names, filled while tokens are appended to a TokenStream
+
+    """
+
+    groups = {FUNC_DECLARATION: "functions", TYPE: "types", ID: "identifiers"}
+
+    def __init__(self):
+        self.functions = dict()
+        self.types = dict()
+        self.identifiers = dict()
+
+    def add(self, name, tag, index):
+        group = getattr(self, self.groups[tag])
+        if (indices := group.get(name)) is None:
+            indices = group[name] = array("q")
+        indices.append(index)
+
+    def extend(self, other, first, last, shift=0):
+        """
+        Add indices first..last of other index moved by shift positions
+
+        """
+
+        for attribute in self.groups.values():
+            group = getattr(self, attribute)
+            for name, indices in getattr(other, attribute).items():
+                low, high = bisect_left(indices, first), bisect_left(indices, last)
+                chosen = indices[low:high]
+                if not chosen:
+                    continue
+
+                if (target := group.get(name)) is None:
+                    target = group[name] = array("q")
+                target.extend(index + shift for index in chosen)
+
+    def has_function(self, name):
+        return name in self.functions
+
+    def declarations(self, name):
+        """
+        Return indices of declarations of function
+        :param name: str
+        :return: array
+        """
+
+        return self.functions.get(name, array("q"))
+
+    def uses(self, name):
+        """
+        Return indices of every identifier with this name
+        :param name: str
+        :return: array
+        """
+
+        return self.identifiers.get(name, array("q"))
+
+
+SYMBOL_MASK = kind_mask(*SymbolIndex.groups)
+
+
+class TokenStream:
+    """
+    Token container keeping kind, start and end offsets in compact arrays
+
+    Values are not stored, they are decoded from the source on access. Rows
+    and columns are resolved through the LineIndex of the source.
+
+    Errors are kept as (mark, text) pairs, where mark is the lexer offset
+    the error was found at. Names of functions, types and identifiers are
+    indexed in ``self.symbols`` as tokens are appended.
+
+    """
+
+    columns = ("kinds", "starts", "ends")
+
+    def __init__(self, source="", lines=None):
+        self.source = source
+        self.kinds = array("B")
+        self.starts = array("q")
+        self.ends = array("q")
+        self.errors = list()
+        self._lines = lines
+        self._numbers = dict()
+        self.symbols = SymbolIndex()
+
+    @property
+    def lines(self):
+        if self._lines is None:
+            self._lines = LineIndex(self.source)
+
+        return self._lines
+
+    def position(self, index):
+        """
+        Return row and column of token at index
+        :param index: int
+        :return: (int, int)
+        """
+
+        return token_position(self.lines, self.kinds[index], self.starts[index])
+
+    def append(self, token):
+        if 1 << token.tag & SYMBOL_MASK:
+            self.symbols.add(token.value, token.tag, len(self.kinds))
+
+        self.kinds.append(token.tag)
+        self.starts.append(token.start)
+        self.ends.append(token.end)
+
+    def extend(self, other, first, last, delta=0):
+        """
+        Append tokens first..last of other stream shifted by delta characters
+
+        """
+
+        self.symbols.extend(other.symbols, first, last, len(self.kinds) - first)
+        self.kinds.extend(other.kinds[first:last])
+
+        if delta:
+            self.starts.extend(start + delta for start in other.starts[first:last])
+            self.ends.extend(end + delta for end in other.ends[first:last])
+        else:
+            self.starts.extend(other.starts[first:last])
+            self.ends.extend(other.ends[first:last])
+
+    def find(self, start):
+        """
+        Return index of token starting at offset or -1
+        :param start: int
+        :return: int
+        """
+
+        index = bisect_left(self.starts, start)
+        if index < len(self.starts) and self.starts[index] == start:
+            return index
+
+        return -1
+
+    def restart_before(self, offset):
+        """
+        Return index of last token ending a line before offset or -1,
+        lexing can restart right after its newline
+        :param offset: int
+        :return: int
+        """
+
+        index = bisect_left(self.starts, offset) - 1
+        while index >= 0:
+            end = self.ends[index]
+            if (
+                1 << self.kinds[index] & RESTART_MASK
+                and end < offset
+                and self.source[end : end + 1] == "\n"
+            ):
+                break
+            index -= 1
+
+        return index
+
+    def type_defined(self, index):
+        """
+        Return whether variable type was defined right after token at index
+        :param index: int
+        :return: bool
+        """
+
+        while index >= 0:
+            if 1 << self.kinds[index] & NAME_MASK:
+                return self.kinds[index] == TYPE
+            index -= 1
+
+        return False
+
+    def error_messages(self):
+        position = self.lines.position
+        return [format_error(text, *position(mark)) for mark, text in self.errors]
+
+    def to_bytes(self):
+        """
+        Return compact binary dump of columns and source, in native byte order
+        :return: bytes
+        """
+
+        source = self.source.encode("utf-8")
+        columns = [getattr(self, name).tobytes() for name in self.columns]
+
+        return b"".join(
+            [DUMP_HEADER.pack(DUMP_MAGIC, len(self), len(source)), *columns, source]
+        )
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Load stream from to_bytes() dump, errors are not included
+        :param data: bytes
+        :return: TokenStream
+        """
+
+        magic, count, source_size = DUMP_HEADER.unpack_from(data)
+        if magic != DUMP_MAGIC:
+            raise ValueError("Not a token stream dump")
+
+        stream, pos = cls(), DUMP_HEADER.size
+        for name in cls.columns:
+            column = getattr(stream, name)
+            size = count * column.itemsize
+            column.frombytes(data[pos : pos + size])
+            pos += size
+
+        stream.source = data[pos : pos + source_size].decode("utf-8")
+
+        for index, kind in enumerate(stream.kinds):
+            if 1 << kind & SYMBOL_MASK:
+                stream.symbols.add(stream.value(index), kind, index)
+
+        return stream
+
+    def value(self, index):
+        """
+        Decode token value from the source
+        :param index: int
+        :return: str | int | float
+        """
+
+        start, end = self.starts[index], self.ends[index]
+
+        if self.kinds[index] == NUMBER:
+            if (number := self._numbers.get(index)) is None:
+                number = token_value(self.source, NUMBER, start, end)
+                self._numbers[index] = number
+
+            return number
+
+        return self.source[start:end]
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.kinds)
+
+        if not 0 <= index < len(self.kinds):
+            raise IndexError("token index out of range")
+
+        return TokenView(self, index)
+
+    def __iter__(self):
+        for index in range(len(self.kinds)):
+            yield TokenView(self, index)
+
+    def __str__(self):
+        return str(list(self))
 
     def __repr__(self):
         return self.__str__()
@@ -29,26 +465,73 @@ class Lexer(dict):
     """
     docstring for Lexer
 
+    The whole source is kept in ``self.string`` and walked by offsets:
+    ``self.pos`` is the offset of the next character to read and
+    ``self.line_start`` is the offset of the current line. Items of the
+    dict map extra single characters to their token Kind.
+
     """
 
-    def __init__(self, file, *args):
+    def __init__(self, file=None, *args):
         super().__init__(*args)
-        self.pos, self.row, self.col = 0, 1, 1
+        self.reset(read_source(file) if file is not None else "")
+
+    def reset(self, string):
+        """
+        Start walking a new source buffer, errors of the previous one are
+        dropped
+
+        """
+        self.string = string
+        self.errors_list = list()
+        self.error_records = list()
+        self.lines = LineIndex(string)
+        self.pos, self.line_start = 0, 0
         self.skip_end = False
         self.variable_type_defined = False
         self.char = ""
-        self.file = open(file, "r")
-        self.string = self.file.readline()
-        self.errors_list = list()
+        self.start = 0
+
+    @property
+    def row(self):
+        return self.lines.row(self.pos)
+
+    @property
+    def col(self):
+        return self.pos - self.line_start + 1
+
+    @property
+    def offset(self):
+        """
+        Offset of the current char
+
+        """
+        return self.pos - 1 if self.char != "#0" else self.pos
+
+    def make_token(self, value, tag, start=None, end=None):
+        """
+        Return token, which ends at current char by default
+        :param value: str | int | float - None to decode it from the source
+        :param tag: int
+        :param start: int
+        :param end: int
+        :return: Token
+        """
+
+        return Token(
+            value,
+            tag,
+            self.start if start is None else start,
+            self.offset if end is None else end,
+            self.lines,
+            self.string,
+        )
 
     def errors(self):
         """
         print all errors
 
         """
-        import sys
-
-        self.file.close()
         sys.stderr.write("Lexer errors:\n")
 
         for i in self.errors_list:
@@ -62,35 +545,26 @@ class Lexer(dict):
         print error
 
         """
-        self.errors_list.append(
-            "{} in line {}, column {}".format(text, self.row, self.col)
-        )
+        self.error_records.append((self.pos, text))
+        self.errors_list.append(format_error(text, self.row, self.col))
 
     def check_end_of_line(self, pos):
         result = True
-        while pos > 0 and self.string[pos] == " ":
+        while pos > self.line_start and self.string[pos] == " ":
             pos -= 1
 
-        if self.string[pos] == ";":
+        if pos >= self.line_start and self.string[pos] == ";":
             result = False
 
         return result
 
     def empty_line(self):
-        line = self.string
-
-        for char in line[:-1]:
-            if char != " ":
-                return False
-
-        return True
+        return not self.string[self.line_start : self.pos].strip(" ")
 
     def skip_line(self):
-        self.string = self.file.readline()
+        self.pos += 1
+        self.line_start = self.pos
         self.skip_end = False
-        self.col = 1
-        self.row += 1
-        self.pos = 0
 
     def next_char(self):
         """
@@ -100,7 +574,6 @@ class Lexer(dict):
         if self.pos < len(self.string):
             self.char = self.string[self.pos]
             if self.char != "\n":
-                self.col += 1
                 self.pos += 1
             else:
                 if self.check_end_of_line(self.pos - 1):
@@ -121,69 +594,42 @@ class Lexer(dict):
 
     @staticmethod
     def compare_signs(lexeme):
-        possible_signs = {
-            "=": EQUAL_SIGN,
-            "==": EQUAL,
-            "!=": NOT_EQUAL,
-            "<": LT,
-            ">": GT,
-            "<=": LE,
-            ">=": GE,
-        }
-
-        return possible_signs.get(lexeme, None)
+        return COMPARE_KINDS.get(lexeme, None)
 
     @staticmethod
     def arithmetics_function(lexeme):
-        possible_signs = {
-            "=": EQUAL_SIGN,
-            "==": EQUAL,
-            "!=": NOT_EQUAL,
-            "<": LT,
-            ">": GT,
-            "<=": LE,
-            ">=": GE,
-        }
-
-        return possible_signs.get(lexeme, None)
+        return COMPARE_KINDS.get(lexeme, None)
 
     @staticmethod
     def logical_operation(lexeme):
-        possible_operation = {
-            "&&": AND,
-            "||": OR,
-        }
-
-        return possible_operation.get(lexeme, None)
+        return LOGICAL_KINDS.get(lexeme, None)
 
     def is_build_in_function(self, lexeme):
-        possible_func_names = {
-            "if": IF,
-            "else": ELSE,
-            "while": WHILE,
-            "for": FOR,
-            "break": BREAK,
-            "continue": CONTINUE,
-            "return": RETURN,
-            "printf": FUNC,
-            "getchar": FUNC,
-            "endl": FUNC,
-            "cout": FUNC,
-            "sizeof": FUNC,
-        }
-
         if not self.variable_type_defined:
-            return possible_func_names.get(lexeme, None)
+            return BUILD_IN_NAMES.get(lexeme, None)
         else:
             self.error(f"Undefined function type: {lexeme}")
 
     def is_function(self):
-        if self.string[self.pos - 1] == "(":
+        if self.char == "(":
             self.variable_type_defined = False
             return True
 
         return False
 
+    def take(self, end):
+        """
+        Make char at offset end current, characters before it are not newlines
+        :param end: int
+        :return: str - slice of source from current char to end
+        """
+
+        lexeme = self.string[self.pos - 1 : end]
+        self.pos = end
+        self.next_char()
+
+        return lexeme
+
     def number_conversion(self, lexeme=""):
         """
         Parsing numbers: float or integer, catch incorrect number input
@@ -191,26 +637,23 @@ class Lexer(dict):
         :return: Token
         """
         if self.char.isdigit():
-            count = 0
-            sign = 1 if lexeme == "+" or lexeme == "" else -1
+            string, pos, size = self.string, self.pos, len(self.string)
+            while pos < size and (string[pos].isdigit() or string[pos] == "."):
+                pos += 1
 
-            while self.char.isdigit() or self.char == ".":
-                if self.char == ".":
-                    count += 1
+            return self.process_number(lexeme + self.take(pos))
 
-                lexeme += self.char
-                self.next_char()
-
-            if count > 1:
-                self.error('Incorrect format of number: "%s"' % lexeme)
-                return None
-            else:
-                return Token(
-                    sign * (int(lexeme)) if count == 0 else sign * (float(lexeme)),
-                    NUMBER,
-                    self.row,
-                    self.col,
-                )
+    def process_number(self, lexeme):
+        """
+        Build number token from lexeme with optional sign
+        :param lexeme: str
+        :return: Token
+        """
+        if lexeme.count(".") > 1:
+            self.error('Incorrect format of number: "%s"' % lexeme)
+            return None
+        else:
+            return self.make_token(None, NUMBER)
 
     def check_names(self, lexeme):
         """
@@ -224,13 +667,11 @@ class Lexer(dict):
         if self.variable_type_defined:
             if self.is_function():
                 self.variable_type_defined = False
-                token = Token(lexeme, FUNC_DECLARATION, self.row, self.col)
-        else:
-            if (func_type := self.is_build_in_function(lexeme)) is not None:
-                token = Token(lexeme, func_type, self.row, self.col)
-            elif lexeme in VARIABLE_TYPES:
+                token = self.make_token(lexeme, FUNC_DECLARATION)
+        elif (kind := NAME_KINDS.get(lexeme)) is not None:
+            if kind == TYPE:
                 self.variable_type_defined = True
-                token = Token(lexeme, TYPE, self.row, self.col)
+            token = self.make_token(lexeme, kind)
 
         return token
 
@@ -241,18 +682,10 @@ class Lexer(dict):
         :return: Token
         """
 
-        token = None
-
-        if lexeme in ARITHMETIC_OPERATIONS:
-            token = Token(lexeme, "ARITHMETIC_OPERATIONS", self.row, self.col)
-        elif lexeme in OVERRIDE_OPERATION:
-            token = Token(lexeme, "OVERRIDE_OPERATION", self.row, self.col)
-        elif (logical_operation := self.logical_operation(lexeme)) is not None:
-            token = Token(lexeme, logical_operation, self.row, self.col)
-        elif (sign_type := self.compare_signs(lexeme)) is not None:
-            token = Token(lexeme, sign_type, self.row, self.col)
+        if (kind := OPERATION_KINDS.get(lexeme)) is not None:
+            return self.make_token(lexeme, kind)
 
-        return token
+        return None
 
     def processing_bracket(self, bracket, *, skip_end=False):
         """
@@ -262,19 +695,10 @@ class Lexer(dict):
         :return: Token
         """
 
-        possible_brackets = {
-            "(": L_PAR,
-            ")": R_PAR,
-            "[": L_SQUARE,
-            "]": R_SQUARE,
-            "{": L_CURL,
-            "}": R_CURL,
-        }
-
         if skip_end:
             self.skip_end = True
 
-        return Token(bracket, possible_brackets[bracket], self.row, self.col)
+        return self.make_token(bracket, BRACKET_KINDS[bracket], end=self.pos)
 
     def check_brackets(self):
         """
@@ -283,158 +707,173 @@ class Lexer(dict):
         """
 
         lexeme = self.char
-        token = None
-
-        if lexeme in ("(", ")"):
-            token = self.processing_bracket(lexeme, skip_end=True)
-        elif lexeme in ("[", "]"):
-            token = self.processing_bracket(lexeme)
-        elif lexeme in ("{", "}"):
-            token = self.processing_bracket(lexeme, skip_end=True)
+        token = self.processing_bracket(lexeme, skip_end=lexeme in SKIP_END_BRACKETS)
 
         self.next_char()
 
         return token
 
-    def next_token(self):
+    def process_name(self, lexeme):
         """
-        Parsing code file and getting tokens
+        Build token for already read name
+        :param lexeme: str
         :return: Token
         """
 
-        self.skip_space()
-        lexeme = ""
+        if (token := self.check_names(lexeme)) is not None:
+            return token
 
-        if self.char.isalpha() or self.char == "_":
-            lexeme = self.char
-            self.next_char()
+        if not self.variable_type_defined:
+            pos, string = self.pos, self.string
+
+            while pos < len(string) and string[pos] == " ":
+                pos += 1
 
-            while self.char.isalpha() or self.char.isdigit():
-                lexeme += self.char
+            if pos < len(string) and string[pos] == "(":
+                self.error(f"Undefined function type '{lexeme}'")
+                return None
+
+        self.variable_type_defined = False
+        return self.make_token(lexeme, ID)
+
+    def process_operation(self, lexeme):
+        """
+        Build token for already read sequence of operation signs
+        :param lexeme: str
+        :return: Token
+        """
+
+        if len(lexeme) > 2:
+            self.error('Incorrect format of operation: "%s"' % lexeme)
+            return None
+        else:
+            if lexeme in ("-", "+"):
+                sign = lexeme
                 self.next_char()
 
-            if (token := self.check_names(lexeme)) is not None:
+                return self.number_conversion(sign)
+
+            elif (token := self.check_operation(lexeme)) is not None:
                 return token
 
-            if not self.variable_type_defined:
-                pos = self.pos
+        self.error('Undefined operation: "%s"' % lexeme)
 
-                while self.string[pos] == " ":
-                    pos += 1
+    def process_quotes(self, character, lexeme, count):
+        """
+        Build token for already read quoted lexeme
+        :param character: str - quote character
+        :param lexeme: str - content between quotes
+        :param count: int - number of characters in content
+        :return: Token
+        """
 
-                if self.string[pos] == "(":
-                    self.error(f"Undefined function type '{lexeme}'")
-                    return None
+        start = self.start + 1
 
-            self.variable_type_defined = False
-            return Token(lexeme, ID, self.row, self.col)
+        if character == "'":
+            if count == 1:
+                return self.make_token(lexeme, CHAR, start, start + len(lexeme))
+        elif character == '"':
+            return self.make_token(lexeme, STRING, start, start + len(lexeme))
 
-        elif self.char in "+-*%><=^!?&|":
-            lexeme, count = self.char, 1
-            self.next_char()
+        self.error("Incorrect quotes: '%s'" % lexeme)
 
-            while self.char in "+-*%><=^!?&|":
-                lexeme += self.char
-                count += 1
-                self.next_char()
+    def process_symbol(self):
+        """
+        Build token for single separator, custom or unknown character
+        :return: Token
+        """
 
-            if count > 2:
-                self.error('Incorrect format of operation: "%s"' % lexeme)
-                return None
-            else:
-                if lexeme in ("-", "+"):
-                    sign = lexeme
-                    self.next_char()
+        lexeme = self.char
 
-                    return self.number_conversion(sign)
+        if lexeme in (";", ","):
+            self.next_char()
+            return self.make_token(
+                lexeme, SEMICOLON if lexeme == ";" else COMMA, end=self.start + 1
+            )
 
-                elif (token := self.check_operation(lexeme)) is not None:
-                    return token
+        elif lexeme in self:
+            self.next_char()
+            return self.make_token(lexeme, self[lexeme], end=self.start + 1)
 
-            self.error('Undefined operation: "%s"' % lexeme)
+        else:
+            self.error('Unknown character: "%s"' % lexeme)
+            self.next_char()
+            return self.make_token(lexeme, UNKNOWN, end=self.start + 1)
 
-        elif self.char.isdigit():
-            return self.number_conversion()
+    def read_name(self):
+        string, pos, size = self.string, self.pos, len(self.string)
+        while pos < size and (string[pos].isalpha() or string[pos].isdigit()):
+            pos += 1
 
-        elif self.char in ("(", ")", "{", "}", "[", "]"):
-            return self.check_brackets()
+        return self.process_name(self.take(pos))
 
-        elif self.char == "#0":
-            return Token("EOF", None, self.row, self.col)
+    def read_operation(self):
+        string, pos, size = self.string, self.pos, len(self.string)
+        while pos < size and string[pos] in OPERATION_CHARS:
+            pos += 1
 
-        elif self.char == "/":
-            lexeme = self.char
-            self.next_char()
-            if self.char in ("/", "*"):
-                return self.skip_comments("\n" if self.char == "/" else "/")
+        return self.process_operation(self.take(pos))
 
-            return Token(lexeme, "ARITHMETIC_OPERATIONS", self.row, self.col)
+    def read_slash(self):
+        lexeme = self.char
+        self.next_char()
+        if self.char in ("/", "*"):
+            return self.skip_comments("\n" if self.char == "/" else "/")
 
-        elif self.char in ('"', "'"):
-            character, count = self.char, 0
-            self.next_char()
+        return self.make_token(lexeme, ARITHMETIC)
 
-            while self.char != character:
-                count += 1
-                condition, lexeme = self.parse_line_end(lexeme)
-                if condition:
-                    continue
+    def read_quotes(self):
+        character, count = self.char, 0
+        self.next_char()
 
-                lexeme += self.char
-                self.next_char()
+        while self.char != character and self.char != "#0":
+            count += 1
+            if self.parse_line_end():
+                continue
 
             self.next_char()
 
-            if character == "'":
-                if count == 1:
-                    return Token(lexeme, CHAR, self.row, self.col)
-            elif character == '"':
-                return Token(lexeme, STRING, self.row, self.col)
+        lexeme = self.string[self.start + 1 : self.offset]
+        self.next_char()
 
-            self.error("Incorrect quotes: '%s'" % lexeme)
+        return self.process_quotes(character, lexeme, count)
 
-        elif self.char in (";", ","):
-            lexeme = self.char
-            self.next_char()
-            return Token(
-                lexeme, SEMICOLON if lexeme == ";" else COMMA, self.row, self.col
-            )
+    def next_token(self):
+        """
+        Parsing code file and getting tokens
+        :return: Token
+        """
 
-        elif self.char == "\n":
-            self.pos -= 1
-            self.col -= 1
-            self.next_char()
-            return None
+        self.skip_space()
+        self.start = self.pos - 1
+        char = self.char
 
-        elif self.char in self:
-            lexeme = self.char
-            self.next_char()
-            return Token(lexeme, self[lexeme], self.row, self.col)
+        if char == "#0":
+            return self.make_token("EOF", EOF, self.offset)
 
-        else:
-            lexeme = self.char
-            self.error('Unknown character: "%s"' % self.char)
-            self.next_char()
-            return Token(lexeme, UNKNOWN, self.row, self.col)
+        if (code := ord(char)) < 256:
+            return FIRST_CHAR[code](self)
+        elif char.isalpha():
+            return self.read_name()
+        elif char.isdigit():
+            return self.number_conversion()
 
-        return None
+        return self.process_symbol()
 
-    def parse_line_end(self, lexeme):
+    def parse_line_end(self):
         """
         Parsing symbol of line end inside C++ char or string types
-        :param lexeme: str
-        :return: (bool, str)
+        :return: bool
         """
 
         if self.char == "\\":
-            lexeme += self.char
-            self.next_char()
-            lexeme += self.char
             self.next_char()
+            if self.char != "#0":
+                self.next_char()
 
-            return True, lexeme
+            return True
 
-        return False, lexeme
+        return False
 
     def skip_comments(self, char):
         """
@@ -445,7 +884,7 @@ class Lexer(dict):
 
         self.skip_end = True
 
-        while self.char != char:
+        while self.char != char and self.char != "#0":
             self.next_char()
 
         self.next_char()
@@ -459,96 +898,441 @@ class Lexer(dict):
         """
 
         self.next_char()
+        yield from self.scan()
+
+    def scan(self):
+        """
+        Returning tokens from current char to the end of source
+        :return: Token
+        """
+
         while True:
             result = self.next_token()
 
             if not result:
                 continue
 
-            if result.value == "EOF":
+            if result.tag == EOF:
                 break
 
             yield result
 
     def tokens(self):
         """
-        Returning list of parsing tokens
-        :return: list
+        Returning stream of parsing tokens
+        :return: TokenStream
         """
 
-        result = [i for i in self.get_token()]
+        first_error = len(self.error_records)
+        result = TokenStream(self.string, self.lines)
+        for token in self.get_token():
+            result.append(token)
+
+        result.errors = self.error_records[first_error:]
         return result
 
     def raw_input(self, user_string):
         """
         Return raw user input
         :param user_string: str
-        :return: list
+        :return: TokenStream
         """
 
-        self.string = user_string
+        self.reset(user_string)
         return self.tokens()
 
+    def relex(self, tokens, offset, removed, inserted):
+        """
+        Re-lex only the edited part of the source lexed into tokens
+
+        Lexing restarts after the last token ending a line before the edit
+        and stops as soon as a new token ending a line matches an old one
+        behind the edit, the rest of old tokens is shifted.
+        :param tokens: TokenStream - tokens of the source before the edit
+        :param offset: int - offset of the edit
+        :param removed: int - number of removed characters
+        :param inserted: str - inserted text
+        :return: TokenStream
+        """
+
+        old_source = tokens.source
+        source = old_source[:offset] + inserted + old_source[offset + removed :]
+        delta = len(inserted) - removed
+        edit_end = offset + len(inserted)
+
+        restart = tokens.restart_before(offset)
+        self.reset(source)
+        first_error = len(self.error_records)
+
+        result = TokenStream(source, self.lines)
+        if restart >= 0:
+            newline = tokens.ends[restart]
+            result.extend(tokens, 0, restart + 1)
+            result.errors = [e for e in tokens.errors if e[0] <= newline + 1]
+
+            # state right after reading the newline which ends restart token
+            self.pos = self.line_start = newline + 1
+            self.char = "\n"
+            self.variable_type_defined = tokens.type_defined(restart)
+            scanner = self.scan()
+        else:
+            scanner = self.get_token()
+
+        for token in scanner:
+            result.append(token)
 
-def draw_tags_groups(tokens):
-    tokens_copy = copy.deepcopy(tokens)
-    tokens_copy.sort(key=lambda x: x.tag)
-    tag_names = {*[token.tag for token in tokens_copy]}
-    tables = []
-    for name in tag_names:
-        table = tt.Texttable()
-        table.header(["Value", "Row", "Column"])
-        for token in filter(lambda x: x.tag == name, tokens_copy):
-            table.add_row((token.value, token.row, token.col))
+            if (
+                not 1 << token.tag & RESTART_MASK
+                or token.start < edit_end
+                or source[token.end : token.end + 1] != "\n"
+            ):
+                continue
+
+            resync = tokens.find(token.start - delta)
+            if (
+                resync >= 0
+                and tokens.kinds[resync] == token.tag
+                and tokens.ends[resync] == token.end - delta
+                and tokens.type_defined(resync) == self.variable_type_defined
+            ):
+                newline = tokens.ends[resync]
+
+                result.errors += self.error_records[first_error:]
+                result.extend(tokens, resync + 1, len(tokens), delta)
+                result.errors += [
+                    (mark + delta, text)
+                    for mark, text in tokens.errors
+                    if mark > newline + 1
+                ]
+                break
+        else:
+            result.errors += self.error_records[first_error:]
+
+        # errors of the lexer cover the whole new source, not only the part
+        # lexed again
+        self.error_records = list(result.errors)
+        self.errors_list = result.error_messages()
+        return result
+
+
+class RegexLexer(Lexer):
+    """
+    Lexer backend matching whole lexemes with one precompiled master regex
+
+    Produces the same tokens and errors as Lexer, which stays available as
+    the character-by-character backend.
+
+    """
+
+    master = re.compile(
+        r"""
+        (?P<space>\s*)
+        (?:
+            (?P<name>[^\W\d][^\W_]*)
+            | (?P<operation>[-+*%><=^!?&|]+)
+            | (?P<number>\d[\d.]*)
+            | (?P<line_comment>//)
+            | (?P<block_comment>/\*)
+            | (?P<slash>/)
+            | (?P<quote>["'])
+        )?
+        """,
+        re.VERBOSE,
+    )
+    quoted = {
+        '"': re.compile(r'(?:\\.|\\\Z|[^"\\])*', re.DOTALL),
+        "'": re.compile(r"(?:\\.|\\\Z|[^'\\])*", re.DOTALL),
+    }
+    escape = re.compile(r"\\.|.", re.DOTALL)
+    number = re.compile(r"\d[\d.]*")
+
+    def seek(self, offset):
+        """
+        Read every character up to offset, so that it becomes current char
+        :param offset: int
+        """
+
+        string = self.string
+        while (newline := string.find("\n", self.pos, offset + 1)) != -1:
+            self.pos = newline
+            self.next_char()
+
+            if newline == offset:
+                return
+
+        if offset < len(string):
+            self.char = string[offset]
+            self.pos = offset + 1
+        else:
+            self.pos = len(string)
+            self.char = "#0"
+
+    def number_conversion(self, lexeme=""):
+        if self.char.isdigit():
+            match = self.number.match(self.string, self.pos - 1)
+            if match is not None:
+                self.seek(match.end())
+                return self.process_number(lexeme + match.group())
+
+    def next_token(self):
+        """
+        Parsing code file and getting tokens
+        :return: Token
+        """
+
+        string = self.string
+
+        while self.char != "#0":
+            match = self.master.match(string, self.pos - 1)
+            kind = match.lastgroup
+            start = match.start(kind)
+
+            if kind == "space":
+                self.seek(match.end())
+                break
+
+            self.seek(start)
+            self.start = start
+
+            if kind == "name":
+                self.seek(match.end())
+                return self.process_name(match.group(kind))
+
+            elif kind == "operation":
+                self.seek(match.end())
+                return self.process_operation(match.group(kind))
+
+            elif kind == "number":
+                return self.number_conversion()
+
+            elif kind == "quote":
+                character = match.group(kind)
+                content = self.quoted[character].match(string, match.end())
+                lexeme = content.group()
+                count = len(self.escape.findall(lexeme)) if character == "'" else 0
+                self.seek(min(content.end() + 1, len(string)))
+                return self.process_quotes(character, lexeme, count)
+
+            elif kind == "slash":
+                self.seek(match.end())
+                return self.make_token("/", ARITHMETIC)
+
+            elif kind == "line_comment":
+                self.skip_end = True
+                end = string.find("\n", start + 2)
+                self.seek(end + 1 if end != -1 else len(string))
+
+            elif kind == "block_comment":
+                self.skip_end = True
+                end = string.find("/", start + 2)
+                self.seek(end + 1 if end != -1 else len(string))
+
+        self.start = self.pos - 1
+
+        if self.char == "#0":
+            return self.make_token("EOF", EOF, self.offset)
+
+        elif self.char in ("(", ")", "{", "}", "[", "]"):
+            return self.check_brackets()
 
-        tables.append((name, table))
+        return self.process_symbol()
 
-    for name, table in tables:
-        print("Tag:", name)
-        print(table.draw())
-        print()
 
+def first_char_table():
+    """
+    Return handlers of Lexer for every character code below 256
+    :return: tuple
+    """
+
+    table = [Lexer.process_symbol] * 256
+    for code in range(256):
+        char = chr(code)
+        if char.isalpha() or char == "_":
+            table[code] = Lexer.read_name
+        elif char in OPERATION_CHARS:
+            table[code] = Lexer.read_operation
+        elif char.isdigit():
+            table[code] = Lexer.number_conversion
+        elif char in BRACKET_KINDS:
+            table[code] = Lexer.check_brackets
+        elif char == "/":
+            table[code] = Lexer.read_slash
+        elif char in ('"', "'"):
+            table[code] = Lexer.read_quotes
+
+    return tuple(table)
+
+
+FIRST_CHAR = first_char_table()
+
+BACKENDS = {
+    "char": Lexer,
+    "regex": RegexLexer,
+}
+
+
+def group_tags(tokens):
+    """
+    Return indices of tokens grouped by tag in one pass
+    :param tokens: TokenStream | list
+    :return: dict - tag: array of indices, in order of tags
+    """
+
+    kinds = (
+        tokens.kinds
+        if isinstance(tokens, TokenStream)
+        else (token.tag for token in tokens)
+    )
+
+    groups = dict()
+    for index, kind in enumerate(kinds):
+        if (group := groups.get(kind)) is None:
+            group = groups[kind] = array("q")
+        group.append(index)
 
-def draw_result_table(tokens):
-    tab = tt.Texttable()
-    headings = ["Value (token)", "Tag", "Row", "Column"]
-    tab.header(headings)
+    return {KINDS[kind]: groups[kind] for kind in sorted(groups)}
 
-    values = list()
-    tags = list()
-    rows = list()
-    columns = list()
 
-    for token in tokens:
-        values.append(token.value)
-        tags.append(token.tag)
-        rows.append(token.row)
-        columns.append(token.col)
+def draw_tags_groups(tokens, output=None, fmt="text"):
+    output = sys.stdout if output is None else output
+    groups = group_tags(tokens)
 
-    for row in zip(values, tags, rows, columns):
-        tab.add_row(row)
-    s = tab.draw()
-    print(s)
+    if fmt != "text":
+        rows = (
+            (KIND_NAMES[tag], tokens[index].value, *tokens[index].position)
+            for tag, group in groups.items()
+            for index in group
+        )
+        write_report(rows, ["Tag", "Value", "Row", "Column"], output, fmt)
+        return
+
+    for tag, group in groups.items():
+        output.write("Tag: %s\n" % KIND_NAMES[tag])
+        rows = ((tokens[index].value, *tokens[index].position) for index in group)
+        write_report(rows, ["Value", "Row", "Column"], output)
+        output.write("\n")
+
+
+def draw_result_table(tokens, output=None, fmt="text"):
+    rows = ((token.value, KIND_NAMES[token.tag], *token.position) for token in tokens)
+    write_report(
+        rows,
+        ["Value (token)", "Tag", "Row", "Column"],
+        output,
+        fmt,
+        ["value", "tag", "row", "column"],
+    )
 
 
 def check_if_main_exist(tokens):
+    if isinstance(tokens, TokenStream):
+        return [tokens[index] for index in tokens.symbols.declarations("main")]
+
     return list(
         filter(lambda x: x.tag == FUNC_DECLARATION and x.value == "main", tokens)
     )
 
 
 def syntax_analyzer(ast, tabs):
-    for i in ast:
-        if isinstance(i, list):
-            syntax_analyzer(i, tabs + 1)
-        else:
-            result, value = tabs * "  |", i.value if not isinstance(i, str) else i
-            print("{}{}".format(result, value))
+    for depth, index in ast.walk():
+        if ast.kinds[index] != NodeKind.GROUP:
+            print("{}{}".format((tabs + depth) * "  |", ast.value(index)))
+
+
+def find_sources(pattern):
+    """
+    Return sorted .cpp files of directory or files matching glob pattern
+    :param pattern: str
+    :return: list
+    """
+
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, "**", "*.cpp")
+
+    return sorted(glob.glob(pattern, recursive=True))
+
+
+def lex_file(path, backend="char", dump=False):
+    """
+    Lex one file, used as process pool task
+    :param path: str
+    :param backend: str - name from BACKENDS
+    :param dump: bool - return tokens as TokenStream.to_bytes() dump
+    :return: (str, TokenStream | bytes, list)
+    """
+
+    lexer = BACKENDS[backend](path)
+    tokens = lexer.tokens()
+
+    return path, tokens.to_bytes() if dump else tokens, lexer.errors_list
+
+
+def lex_files(paths, backend="char", dump=False, workers=None, chunksize=None):
+    """
+    Lex many files in a process pool sized to the core count
+    :param paths: list
+    :param backend: str - name from BACKENDS
+    :param dump: bool - return binary dumps instead of TokenStream
+    :param workers: int - number of processes, core count by default
+    :param chunksize: int - files sent to a process at once
+    :return: generator of (path, tokens, errors) in order of paths
+    """
+
+    paths = list(paths)
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, len(paths) // (workers * 4))
+
+    task = partial(lex_file, backend=backend, dump=dump)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(task, paths, chunksize=chunksize)
+
+
+def lex_batch(options):
+    paths = [path for pattern in options.sources for path in find_sources(pattern)]
+    dump = options.dump is not None
+    failed = False
+
+    results = lex_files(paths, options.backend, dump, options.jobs, options.chunksize)
+    if paths:
+        base = os.path.commonpath([os.path.dirname(path) for path in paths])
+
+    for path, tokens, errors in results:
+        if dump:
+            name = os.path.splitext(os.path.relpath(path, base))[0] + ".tok"
+            target = os.path.join(options.dump, name)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, "wb") as file:
+                file.write(tokens)
+
+        print("{}: {} errors".format(path, len(errors)))
+        for error in errors:
+            sys.stderr.write("\t%s\n" % error)
+
+        failed = failed or bool(errors)
+
+    return failed
 
 
 if __name__ == "__main__":
+    arguments = argparse.ArgumentParser(description="C++ lexer")
+    arguments.add_argument(
+        "sources", nargs="*", help="directories or glob patterns of .cpp files"
+    )
+    arguments.add_argument("--backend", choices=BACKENDS, default="char")
+    arguments.add_argument("--jobs", type=int, help="number of processes")
+    arguments.add_argument("--chunksize", type=int, help="files per task")
+    arguments.add_argument("--dump", metavar="DIR", help="write binary token dumps")
+    arguments.add_argument(
+        "--format", choices=FORMATS, default="text", help="format of token tables"
+    )
+    options = arguments.parse_args()
+
+    if options.sources:
+        exit(1 if lex_batch(options) else 0)
+
     path = "main_1.cpp"
-    lexer = Lexer(path)
+    lexer = BACKENDS[options.backend](path)
     parser = Parser()
     tokens = lexer.tokens()
     if len(check_if_main_exist(tokens)) == 0:
@@ -557,8 +1341,8 @@ if __name__ == "__main__":
     if lexer.errors_list:
         lexer.errors()
 
-    draw_result_table(tokens)
-    draw_tags_groups(tokens)
+    draw_result_table(tokens, fmt=options.format)
+    draw_tags_groups(tokens, fmt=options.format)
 
     ast = parser.build(tokens)
     syntax_analyzer(ast, 2)
@@ -1,42 +1,166 @@
-RESERVED = "RESERVED"
-UNKNOWN = "UNKNOWN"
-NUMBER = "NUMBER"
-STRING = "STRING"
-CHAR = "CHAR"
-QUOTE = "QUOTE"
-ID = "ID"
-
-FUNC = "FUNCTION"
-FUNC_DECLARATION = "CUSTOM FUNCTION"
-TYPE = "VARIABLE TYPE"
-
-EQUAL_SIGN = "EQUAL_SIGN"
-L_PAR = "LEFT PAR"
-R_PAR = "RIGHT PAR"
-L_CURL = "LEFT CURL"
-R_CURL = "RIGHT CURL"
-L_SQUARE = "LEFT SQUARE"
-R_SQUARE = "RIGHT SQUARE"
-SEMICOLON = "SEMICOLON"
-COMMA = "COMMA"
-
-IF = "IF"
-ELSE = "ELSE"
-WHILE = "WHILE"
-FOR = "FOR"
-BREAK = "BREAK"
-CONTINUE = "CONTINUE"
-RETURN = "RETURN"
-
-EQUAL = "EQUAL"
-NOT_EQUAL = "NOT EQUAL"
-GT = "GT"
-LT = "LT"
-GE = "GE"
-LE = "LE"
-
-AND = "AND"
-OR = "OR"
+from enum import IntEnum
+from types import MappingProxyType
+
+
+class Kind(IntEnum):
+    """
+    Compact token kind codes
+
+    """
+
+    EOF = 0
+    RESERVED = 1
+    UNKNOWN = 2
+    NUMBER = 3
+    STRING = 4
+    CHAR = 5
+    QUOTE = 6
+    ID = 7
+
+    FUNC = 8
+    FUNC_DECLARATION = 9
+    TYPE = 10
+
+    EQUAL_SIGN = 11
+    L_PAR = 12
+    R_PAR = 13
+    L_CURL = 14
+    R_CURL = 15
+    L_SQUARE = 16
+    R_SQUARE = 17
+    SEMICOLON = 18
+    COMMA = 19
+
+    IF = 20
+    ELSE = 21
+    WHILE = 22
+    FOR = 23
+    BREAK = 24
+    CONTINUE = 25
+    RETURN = 26
+
+    EQUAL = 27
+    NOT_EQUAL = 28
+    GT = 29
+    LT = 30
+    GE = 31
+    LE = 32
+
+    AND = 33
+    OR = 34
+
+    ARITHMETIC = 35
+    OVERRIDE = 36
+
+
+KINDS = tuple(Kind)
+
+EOF = Kind.EOF
+RESERVED = Kind.RESERVED
+UNKNOWN = Kind.UNKNOWN
+NUMBER = Kind.NUMBER
+STRING = Kind.STRING
+CHAR = Kind.CHAR
+QUOTE = Kind.QUOTE
+ID = Kind.ID
+
+FUNC = Kind.FUNC
+FUNC_DECLARATION = Kind.FUNC_DECLARATION
+TYPE = Kind.TYPE
+
+EQUAL_SIGN = Kind.EQUAL_SIGN
+L_PAR = Kind.L_PAR
+R_PAR = Kind.R_PAR
+L_CURL = Kind.L_CURL
+R_CURL = Kind.R_CURL
+L_SQUARE = Kind.L_SQUARE
+R_SQUARE = Kind.R_SQUARE
+SEMICOLON = Kind.SEMICOLON
+COMMA = Kind.COMMA
+
+IF = Kind.IF
+ELSE = Kind.ELSE
+WHILE = Kind.WHILE
+FOR = Kind.FOR
+BREAK = Kind.BREAK
+CONTINUE = Kind.CONTINUE
+RETURN = Kind.RETURN
+
+EQUAL = Kind.EQUAL
+NOT_EQUAL = Kind.NOT_EQUAL
+GT = Kind.GT
+LT = Kind.LT
+GE = Kind.GE
+LE = Kind.LE
+
+AND = Kind.AND
+OR = Kind.OR
+
+ARITHMETIC = Kind.ARITHMETIC
+OVERRIDE = Kind.OVERRIDE
+
+# names used only to display tokens
+KIND_NAMES = {
+    EOF: "EOF",
+    RESERVED: "RESERVED",
+    UNKNOWN: "UNKNOWN",
+    NUMBER: "NUMBER",
+    STRING: "STRING",
+    CHAR: "CHAR",
+    QUOTE: "QUOTE",
+    ID: "ID",
+    FUNC: "FUNCTION",
+    FUNC_DECLARATION: "CUSTOM FUNCTION",
+    TYPE: "VARIABLE TYPE",
+    EQUAL_SIGN: "EQUAL_SIGN",
+    L_PAR: "LEFT PAR",
+    R_PAR: "RIGHT PAR",
+    L_CURL: "LEFT CURL",
+    R_CURL: "RIGHT CURL",
+    L_SQUARE: "LEFT SQUARE",
+    R_SQUARE: "RIGHT SQUARE",
+    SEMICOLON: "SEMICOLON",
+    COMMA: "COMMA",
+    IF: "IF",
+    ELSE: "ELSE",
+    WHILE: "WHILE",
+    FOR: "FOR",
+    BREAK: "BREAK",
+    CONTINUE: "CONTINUE",
+    RETURN: "RETURN",
+    EQUAL: "EQUAL",
+    NOT_EQUAL: "NOT EQUAL",
+    GT: "GT",
+    LT: "LT",
+    GE: "GE",
+    LE: "LE",
+    AND: "AND",
+    OR: "OR",
+    ARITHMETIC: "ARITHMETIC_OPERATIONS",
+    OVERRIDE: "OVERRIDE_OPERATION",
+}
+
+
+def kind_mask(*kinds):
+    """
+    Return bitmask with one bit per kind, test with: 1 << kind & mask
+    :return: int
+    """
+
+    mask = 0
+    for kind in kinds:
+        mask |= 1 << kind
+
+    return mask
+
+
+COMPARISON_MASK = kind_mask(EQUAL, NOT_EQUAL, GT, LT, GE, LE)
+OPERATION_MASK = kind_mask(ARITHMETIC, OVERRIDE, EQUAL_SIGN) | COMPARISON_MASK
+LOGICAL_MASK = kind_mask(AND, OR)
+BRACKET_MASK = kind_mask(L_PAR, R_PAR, L_CURL, R_CURL, L_SQUARE, R_SQUARE)
+OPEN_BRACKET_MASK = kind_mask(L_PAR, L_CURL, L_SQUARE)
+CLOSE_BRACKET_MASK = kind_mask(R_PAR, R_CURL, R_SQUARE)
+STATEMENT_MASK = kind_mask(IF, WHILE, FOR)
 
 ARITHMETIC_OPERATIONS = {
     "+",
@@ -72,3 +196,68 @@ VARIABLE_TYPES = [
     "string",
     "bool",
 ]
+
+# frozen lookup tables shared by all lexers
+BUILD_IN_NAMES = MappingProxyType(
+    {
+        "if": IF,
+        "else": ELSE,
+        "while": WHILE,
+        "for": FOR,
+        "break": BREAK,
+        "continue": CONTINUE,
+        "return": RETURN,
+        "printf": FUNC,
+        "getchar": FUNC,
+        "endl": FUNC,
+        "cout": FUNC,
+        "sizeof": FUNC,
+    }
+)
+
+NAME_KINDS = MappingProxyType({**BUILD_IN_NAMES, **dict.fromkeys(VARIABLE_TYPES, TYPE)})
+
+COMPARE_KINDS = MappingProxyType(
+    {
+        "=": EQUAL_SIGN,
+        "==": EQUAL,
+        "!=": NOT_EQUAL,
+        "<": LT,
+        ">": GT,
+        "<=": LE,
+        ">=": GE,
+    }
+)
+
+LOGICAL_KINDS = MappingProxyType(
+    {
+        "&&": AND,
+        "||": OR,
+    }
+)
+
+# later groups take precedence, "=" is an arithmetic operation
+OPERATION_KINDS = MappingProxyType(
+    {
+        **COMPARE_KINDS,
+        **LOGICAL_KINDS,
+        **dict.fromkeys(OVERRIDE_OPERATION, OVERRIDE),
+        **dict.fromkeys(ARITHMETIC_OPERATIONS, ARITHMETIC),
+    }
+)
+
+BRACKET_KINDS = MappingProxyType(
+    {
+        "(": L_PAR,
+        ")": R_PAR,
+        "[": L_SQUARE,
+        "]": R_SQUARE,
+        "{": L_CURL,
+        "}": R_CURL,
+    }
+)
+
+# brackets after which missing end of line is not reported
+SKIP_END_BRACKETS = frozenset("(){}")
+
+OPERATION_CHARS = frozenset("+-*%><=^!?&|")
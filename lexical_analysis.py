@@ -1,9 +1,19 @@
+import argparse
+import glob
+import hashlib
+import os
 import re
+import sys
+import threading
+from collections import ChainMap
+from importlib import import_module
 
-import texttable as tt
 from ply import lex
 from ply.lex import TOKEN
 
+from line_index import LineIndex
+from token_report import FORMATS, write_report
+
 tokens = (
     "FUNCDECL",
     "LPAR",
@@ -120,28 +130,27 @@ def t_NUMBER(t):
     return t
 
 
-class TypeDefine:
-    type_define = False
-
-
 @TOKEN(identifier)
 def t_ID(t):
-    if TypeDefine.type_define:
-        TypeDefine.type_define = False
-        if t.lexer.lexdata[t.lexpos + len(t.value)] == "(":
+    lexer = t.lexer
+    reserved = lexer.reserved
+
+    if lexer.type_define:
+        lexer.type_define = False
+        if lexer.lexdata[t.lexpos + len(t.value)] == "(":
             reserved[t.value] = "CUSTOM_FUNC"
             t.type = "FUNCDECL"
         else:
             t.type = "ID"
     else:
-        if t.lexer.lexdata[t.lexpos + len(t.value)] == "(":
+        if lexer.lexdata[t.lexpos + len(t.value)] == "(":
             if (value := reserved.get(t.value, None)) is None:
-                print("error")
+                lexer.report("error")
             else:
                 t.type = value
         else:
             if (res := types.get(t.value, "ID")) == "VARIABLE_TYPE":
-                TypeDefine.type_define = True
+                lexer.type_define = True
 
             t.type = res if t.value not in reserved else reserved[t.value]
 
@@ -149,7 +158,7 @@ def t_ID(t):
 
 
 def t_error(t):
-    print("Illegal character '%s' at line %d" % (t.value[0], t.lineno))
+    t.lexer.report("Illegal character '%s' at line %d" % (t.value[0], t.lineno))
     t.lexer.skip(1)
 
 
@@ -203,37 +212,208 @@ int main()
 }"""
 
 
-lexer = lex.lex(reflags=re.UNICODE | re.DOTALL)
+REFLAGS = re.UNICODE | re.DOTALL
+LEXTAB_PREFIX = "lextab_"
 
+_master = None
+_master_lock = threading.Lock()
 
-def display_tokens():
-    tab = tt.Texttable()
-    headings = ["Value (token)", "Tag", "Row", "Column"]
-    tab.header(headings)
-    lexer.input(data)
 
-    character_number, line_number = 0, 0
-    while True:
-        tok = lexer.token()
+def rules_signature():
+    """
+    Return short hash of everything the master regex is built from
+    :return: str
+    """
 
-        if not tok:
-            break
+    rules = [(name, value) for name, value in globals().items() if name[:2] == "t_"]
+    functions = sorted(
+        (value.__code__.co_firstlineno, name, getattr(value, "regex", value.__doc__))
+        for name, value in rules
+        if callable(value)
+    )
+    strings = sorted((name, value) for name, value in rules if isinstance(value, str))
 
-        if line_number < tok.lineno:
-            character_number = tok.lexpos
-            line_number = tok.lineno
-
-        tab.add_row(
-            (
-                tok.value,
-                tok.type,
-                tok.lineno,
-                tok.lexpos - character_number + len(str(tok.value)),
-            )
+    # PLY orders rule functions by line, only their order matters
+    signature = repr(
+        (
+            lex.__tabversion__,
+            int(REFLAGS),
+            tokens,
+            [function[1:] for function in functions],
+            strings,
         )
-    s = tab.draw()
-    print(s)
+    )
+    return hashlib.sha1(signature.encode("utf-8")).hexdigest()[:12]
+
+
+def remove_stale_lextabs(lextab):
+    directory = os.path.dirname(os.path.abspath(__file__))
+
+    for path in glob.glob(os.path.join(directory, LEXTAB_PREFIX + "*.py")):
+        if os.path.basename(path) != lextab + ".py":
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def write_lextab(lexer, lextab):
+    """
+    Save tables of lexer atomically, failures only cost a rebuild later
+    :param lexer: ply.lex.Lexer
+    :param lextab: str - module name
+    """
+
+    directory = os.path.dirname(os.path.abspath(__file__))
+    # outside of LEXTAB_PREFIX, so other processes never import or remove it
+    temporary = "_tmp%d_%s" % (os.getpid(), lextab)
+    path = os.path.join(directory, temporary + ".py")
+
+    try:
+        lexer.writetab(temporary, directory)
+        os.replace(path, os.path.join(directory, lextab + ".py"))
+    except OSError:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def load_lextab(lextab):
+    # a broken or foreign table is rebuilt, PLY would only catch ImportError
+    try:
+        table = import_module(lextab)
+    except (ImportError, SyntaxError, ValueError):
+        return None
+
+    return table if getattr(table, "_tabversion", None) == lex.__tabversion__ else None
+
+
+class ReentrantLexer(lex.Lexer):
+    """
+    PLY lexer whose clones get their own overlay of reserved words
+
+    Diagnostics are kept in diagnostics, so a parse served from a cache can
+    print them again, and printed unless echo is off.
+
+    """
+
+    echo = True
+
+    def clone(self, object=None):
+        lexer = super().clone(object)
+        lexer.reserved = ChainMap(dict(), reserved)
+        lexer.type_define = False
+        lexer.diagnostics = list()
+        return lexer
+
+    def report(self, message):
+        self.diagnostics.append(message)
+        if self.echo:
+            print(message)
+
+
+def get_master():
+    """
+    Build master lexer on first use
+
+    Tables of the optimized lexer are cached in a lextab module named after
+    rules_signature(), rules are validated only when it has to be written.
+    The module is written under a temporary name and renamed into place, so
+    processes starting together never import a half-written table.
+    :return: ply.lex.Lexer
+    """
+
+    global _master
+
+    with _master_lock:
+        if _master is None:
+            module = sys.modules[__name__]
+            lextab = LEXTAB_PREFIX + rules_signature()
+
+            if (table := load_lextab(lextab)) is None:
+                master = lex.lex(module=module, reflags=REFLAGS)
+                write_lextab(master, lextab)
+                remove_stale_lextabs(lextab)
+            else:
+                master = lex.lex(
+                    module=module, optimize=True, lextab=table, reflags=REFLAGS
+                )
+            master.__class__ = ReentrantLexer
+            master.reserved = ChainMap(dict(), reserved)
+            master.type_define = False
+            master.diagnostics = list()
+            _master = master
+
+    return _master
+
+
+def new_lexer():
+    """
+    Return lexer cloned from the prebuilt master with its own state
+
+    Custom function names found by the lexer go to its overlay of reserved
+    words, so lexers of different sources may run in parallel threads.
+    :return: ply.lex.Lexer
+    """
+
+    return get_master().clone()
+
+
+def __getattr__(name):
+    # master and shared lexer are built only when somebody asks for them
+    if name == "master":
+        return get_master()
+    elif name == "lexer":
+        globals()["lexer"] = new_lexer()
+        return globals()["lexer"]
+
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def read_data(source):
+    """
+    Return code of path or text stream, the built-in example by default
+    :param source: str | file
+    :return: str
+    """
+
+    if source is None:
+        return data
+    elif hasattr(source, "read"):
+        return source.read()
+
+    with open(source, "r") as file:
+        return file.read()
+
+
+def display_tokens(source=None, output=None, fmt="text"):
+    """
+    Write tokens of source while they are lexed
+    :param source: str | file - path or text stream, example code by default
+    :param output: file - sys.stdout by default
+    :param fmt: str - "text", "tsv", "csv" or "jsonl"
+    """
+
+    code = read_data(source)
+    lexer = new_lexer()
+    lexer.input(code)
+    position = LineIndex(code).position
+
+    rows = ((tok.value, tok.type, *position(tok.lexpos)) for tok in lexer)
+    write_report(
+        rows,
+        ["Value (token)", "Tag", "Row", "Column"],
+        output,
+        fmt,
+        ["value", "tag", "row", "column"],
+    )
 
 
 if __name__ == "__main__":
-    display_tokens()
+    arguments = argparse.ArgumentParser(description="Tokens of C++ source")
+    arguments.add_argument("source", nargs="?", help="path, example code by default")
+    arguments.add_argument("--format", choices=FORMATS, default="text")
+    options = arguments.parse_args()
+
+    display_tokens(options.source, fmt=options.format)
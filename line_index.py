@@ -0,0 +1,48 @@
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+
+
+class LineIndex(object):
+    """
+    Offsets of line starts in source, resolves offsets to rows and columns
+
+    """
+
+    def __init__(self, source):
+        lines = source.split("\n")
+        # start of every line is the sum of previous lengths plus newlines
+        self.starts = array(
+            "q", accumulate(map((1).__add__, map(len, lines[:-1])), initial=0)
+        )
+
+    def __len__(self):
+        return len(self.starts)
+
+    def row(self, offset):
+        """
+        Return 1-based row of offset
+        :param offset: int
+        :return: int
+        """
+
+        return bisect_right(self.starts, offset)
+
+    def line_start(self, row):
+        """
+        Return offset of 1-based row
+        :param row: int
+        :return: int
+        """
+
+        return self.starts[row - 1]
+
+    def position(self, offset):
+        """
+        Return 1-based row and column of offset
+        :param offset: int
+        :return: (int, int)
+        """
+
+        row = bisect_right(self.starts, offset)
+        return row, offset - self.starts[row - 1] + 1
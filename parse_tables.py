@@ -0,0 +1,141 @@
+"""
+Binary LALR tables for PLY yacc
+
+The tables are kept in one marshal file instead of a generated parsetab.py
+module, so loading them compiles and runs no Python source. yacc reads all
+of them as it starts, the file is decoded with one marshal.load on first
+access. It is regenerated when the grammar signature changes.
+
+"""
+
+import marshal
+import os
+import struct
+import types
+
+from ply import yacc
+
+MAGIC = b"MPTB"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<4sBB")
+# grammar report written beside the tables whenever they are built
+DEBUG_FILE = "parser.out"
+
+# module attributes read by yacc, in the order they are stored
+ATTRIBUTES = (
+    "_tabversion",
+    "_lr_method",
+    "_lr_signature",
+    "_lr_action",
+    "_lr_goto",
+    "_lr_productions",
+)
+
+
+class ParseTables(types.ModuleType):
+    """
+    Table module for yacc.yacc(tabmodule=...) backed by a binary file
+
+    A missing or unreadable file raises ImportError on first access, which
+    makes yacc build the tables from the grammar.
+
+    """
+
+    def __init__(self, path):
+        super().__init__(os.path.splitext(os.path.basename(path))[0])
+        self.__file__ = path
+
+    def _load(self):
+        try:
+            with open(self.__file__, "rb") as file:
+                header = file.read(HEADER.size)
+                if len(header) < HEADER.size:
+                    raise ImportError("Truncated parse tables")
+                if HEADER.unpack(header) != (MAGIC, FORMAT_VERSION, marshal.version):
+                    raise ImportError("Parse tables of another format")
+                tables = marshal.load(file)
+        except OSError as error:
+            raise ImportError("Can't read parse tables: %s" % error)
+        except (EOFError, ValueError, TypeError) as error:
+            raise ImportError("Broken parse tables: %s" % error)
+
+        if not isinstance(tables, tuple) or len(tables) != len(ATTRIBUTES):
+            raise ImportError("Broken parse tables")
+
+        for name, value in zip(ATTRIBUTES, tables):
+            setattr(self, name, value)
+
+    def __getattr__(self, name):
+        if name not in ATTRIBUTES:
+            raise AttributeError(name)
+
+        self._load()
+        return getattr(self, name)
+
+
+def write_tables(path, parser, signature):
+    """
+    Save tables of parser atomically, failures only cost a rebuild later
+    :param path: str
+    :param parser: ply.yacc.LRParser
+    :param signature: str - grammar signature the tables are built for
+    """
+
+    productions = [
+        (p.str, p.name, p.len, p.func, os.path.basename(p.file), p.line)
+        for p in parser.productions
+    ]
+    tables = (
+        yacc.__tabversion__,
+        "LALR",
+        signature,
+        parser.action,
+        parser.goto,
+        productions,
+    )
+
+    temporary = "%s.%d.tmp" % (path, os.getpid())
+    try:
+        with open(temporary, "wb") as file:
+            file.write(HEADER.pack(MAGIC, FORMAT_VERSION, marshal.version))
+            marshal.dump(tables, file)
+        os.replace(temporary, path)
+    except OSError:
+        try:
+            os.remove(temporary)
+        except OSError:
+            pass
+
+
+def load_parser(module, path):
+    """
+    Return parser of grammar module using binary tables at path
+
+    Tables are built from the grammar only when path holds none for its
+    signature, and only then DEBUG_FILE is written beside them, so the
+    report follows every grammar change without slowing other starts.
+    :param module: module - with p_ rules and tokens
+    :param path: str
+    :return: ply.yacc.LRParser - with grammar signature in its signature
+    """
+
+    tables = ParseTables(path)
+    parser = yacc.yacc(
+        module=module,
+        tabmodule=tables,
+        debug=True,
+        debugfile=DEBUG_FILE,
+        outputdir=os.path.dirname(path),
+        write_tables=False,
+    )
+
+    if isinstance(parser.productions[0], yacc.MiniProduction):
+        parser.signature = tables._lr_signature
+    else:
+        # tables were built from the grammar, keep them for next start
+        grammar = yacc.ParserReflect(dict(vars(module)))
+        grammar.get_all()
+        parser.signature = grammar.signature()
+        write_tables(path, parser, parser.signature)
+
+    return parser
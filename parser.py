@@ -1,5 +1,241 @@
+from array import array
+from collections import deque
+from enum import IntEnum
+
 from lexer_constants import *
 
+CLOSING = {
+    L_CURL: "}",
+    L_PAR: ")",
+}
+CLOSING_KIND = {
+    L_CURL: R_CURL,
+    L_PAR: R_PAR,
+}
+CLOSE_MASK = kind_mask(R_CURL, R_PAR)
+LEAF_MASK = OPERATION_MASK | kind_mask(COMMA)
+
+MARKERS = (
+    "program: ",
+    "end program",
+    "function declaration:",
+    "args:",
+    "body:",
+    "condition:",
+    "(",
+    ")",
+    "{",
+    "}",
+)
+MARKER_INDEX = {text: index for index, text in enumerate(MARKERS)}
+
+
+class TokenWindow(object):
+    """
+    Lookahead buffer over any iterable of tokens
+
+    Tokens are pulled from the iterable on demand and dropped once released,
+    so a generator of tokens is never materialised.
+
+    """
+
+    def __init__(self, tokens):
+        self.iterator = iter(tokens)
+        self.buffer = deque()
+        self.first = 0
+
+    def __getitem__(self, pos):
+        if pos < self.first:
+            raise IndexError("token %d is already released" % pos)
+
+        while pos - self.first >= len(self.buffer):
+            if (token := next(self.iterator, None)) is None:
+                raise IndexError("token index out of range")
+            self.buffer.append(token)
+
+        return self.buffer[pos - self.first]
+
+    def at_end(self, pos):
+        try:
+            self[pos]
+        except IndexError:
+            return True
+
+        return False
+
+    def release(self, pos):
+        """
+        drop tokens before pos
+
+        """
+        while self.first < pos and self.buffer:
+            self.buffer.popleft()
+            self.first += 1
+
+
+class NodeKind(IntEnum):
+    GROUP = 0
+    TOKEN = 1
+    TEXT = 2
+
+
+class Node(object):
+    """
+    View of one node of Tree
+
+    """
+
+    __slots__ = ("tree", "index")
+
+    def __init__(self, tree, index):
+        self.tree = tree
+        self.index = index
+
+    @property
+    def kind(self):
+        return NodeKind(self.tree.kinds[self.index])
+
+    @property
+    def token(self):
+        if self.tree.kinds[self.index] == NodeKind.TOKEN:
+            return self.tree.token(self.tree.items[self.index])
+
+    @property
+    def value(self):
+        return self.tree.value(self.index)
+
+    def __iter__(self):
+        child = self.tree.first_child[self.index]
+        while child >= 0:
+            yield Node(self.tree, child)
+            child = self.tree.next_sibling[child]
+
+    def __repr__(self):
+        return "<Node {} {}>".format(self.kind.name, self.value)
+
+
+class Tree(object):
+    """
+    AST kept in parallel arrays, node 0 is the root group
+
+    A node is a group of other nodes, a token or a marker text. Children of
+    a group are linked by first_child and next_sibling, -1 ends the list.
+    Items hold index of token for tokens and index in MARKERS for texts.
+
+    """
+
+    columns = ("kinds", "first_child", "next_sibling", "items")
+
+    def __init__(self, tokens=()):
+        self.kinds = array("B")
+        self.first_child = array("i")
+        self.next_sibling = array("i")
+        self.items = array("i")
+        self.last_child = array("i")
+
+        # tokens of sequences are found by index, others are kept here
+        self.indexed = hasattr(tokens, "__getitem__") and hasattr(tokens, "__len__")
+        self.tokens = tokens if self.indexed else list()
+
+        self.add(-1, NodeKind.GROUP)
+
+    @property
+    def root(self):
+        return Node(self, 0)
+
+    def add(self, parent, kind, item=-1):
+        """
+        Append new last child of parent
+        :param parent: int
+        :param kind: NodeKind
+        :param item: int
+        :return: int - index of the node
+        """
+
+        index = len(self.kinds)
+        self.kinds.append(kind)
+        self.first_child.append(-1)
+        self.next_sibling.append(-1)
+        self.items.append(item)
+        self.last_child.append(-1)
+
+        if parent >= 0:
+            last = self.last_child[parent]
+            if last < 0:
+                self.first_child[parent] = index
+            else:
+                self.next_sibling[last] = index
+            self.last_child[parent] = index
+
+        return index
+
+    def group(self, parent):
+        return self.add(parent, NodeKind.GROUP)
+
+    def text(self, parent, text):
+        return self.add(parent, NodeKind.TEXT, MARKER_INDEX[text])
+
+    def add_token(self, parent, pos, token):
+        if not self.indexed:
+            self.tokens.append(token)
+            pos = len(self.tokens) - 1
+
+        return self.add(parent, NodeKind.TOKEN, pos)
+
+    def token(self, item):
+        return self.tokens[item]
+
+    def compact(self):
+        """
+        Trim columns to their size and drop last_child used to add nodes,
+        the tree is read only afterwards
+
+        """
+
+        for name in self.columns:
+            column = getattr(self, name)
+            setattr(self, name, array(column.typecode, column))
+
+        self.last_child = None
+
+    def value(self, index):
+        """
+        Return token value or marker text of node, None for groups
+        :param index: int
+        :return: str | int | float
+        """
+
+        kind, item = self.kinds[index], self.items[index]
+        if kind == NodeKind.TOKEN:
+            return self.tokens[item].value
+        elif kind == NodeKind.TEXT:
+            return MARKERS[item]
+
+    def walk(self, index=0):
+        """
+        Yield depth and index of every node below index in pre-order
+        :param index: int
+        :return: generator of (int, int)
+        """
+
+        first_child, next_sibling = self.first_child, self.next_sibling
+        stack = [first_child[index]]
+
+        while stack:
+            child = stack[-1]
+            if child < 0:
+                stack.pop()
+                continue
+
+            stack[-1] = next_sibling[child]
+            yield len(stack) - 1, child
+
+            if first_child[child] >= 0:
+                stack.append(first_child[child])
+
+    def __len__(self):
+        return len(self.kinds)
+
 
 class Parser(object):
     """
@@ -9,75 +245,102 @@ class Parser(object):
 
     def __init__(self):
         self.tokens = None
+        self.tree = None
 
-    def _node(self, pos):
+    def _node(self, pos, parent):
         """
-        return new node and pos
+        fill parent group up to closing bracket and return its pos
+
+        Nested brackets are collected with an explicit stack of the groups
+        they are opened in, so nesting depth is not limited by recursion.
 
         """
-        possible_values = {
-            "{": "}",
-            "(": ")",
-        }
+        tokens, tree = self.tokens, self.tree
+        opening = tokens[pos - 1]
+        stack = list()
+        node = parent
 
-        node = list()
-        try:
-            while self.tokens[pos].value not in possible_values.values():
-                delimiter = self.tokens[pos]
-                if delimiter.value in possible_values.keys():
-                    new_node, pos = self._node(pos + 1)
-                    node.append(
-                        [delimiter.value, new_node, possible_values[delimiter.value]]
+        while True:
+            try:
+                delimiter = tokens[pos]
+            except IndexError:
+                if stack:
+                    opening = stack[-1][2]
+
+                msg = 'Parser error! Missing symbol "%s"' % CLOSING[opening.tag]
+                msg += ' for "{}" in line {}, column {}'.format(
+                    opening.value, opening.row, opening.col
+                )
+                raise Exception(msg)
+
+            kind = delimiter.tag
+            if 1 << kind & CLOSE_MASK:
+                bracket = stack[-1][2] if stack else opening
+                if kind != CLOSING_KIND[bracket.tag]:
+                    msg = 'Parser error! Missing symbol "%s"' % CLOSING[bracket.tag]
+                    msg += ' for "{}" in line {}, column {}'.format(
+                        bracket.value, bracket.row, bracket.col
+                    )
+                    msg += ', found "{}" in line {}, column {}'.format(
+                        delimiter.value, delimiter.row, delimiter.col
                     )
+                    raise Exception(msg)
+
+                if not stack:
+                    return pos
+
+                node, wrapper, bracket = stack.pop()
+                tree.text(wrapper, CLOSING[bracket.tag])
+            else:
+                tokens.release(pos)
+                if kind in CLOSING:
+                    wrapper = tree.group(node)
+                    tree.text(wrapper, delimiter.value)
+                    stack.append((node, wrapper, delimiter))
+                    node = tree.group(wrapper)
+                elif 1 << kind & LEAF_MASK:
+                    tree.add_token(tree.group(node), pos, delimiter)
+                elif 1 << kind & STATEMENT_MASK:
+                    tree.add_token(node, pos, delimiter)
+                    tree.text(tree.group(node), "condition:")
                 else:
-                    if delimiter.value in [
-                        *ARITHMETIC_OPERATIONS,
-                        *OVERRIDE_OPERATION,
-                        *COMPARE_SIGNS,
-                        ",",
-                    ]:
-                        node.append([self.tokens[pos]])
-                    elif delimiter.tag in [WHILE, FOR, IF]:
-                        node.extend([self.tokens[pos], ["condition:"]])
-                    else:
-                        node.append(self.tokens[pos])
-                pos += 1
-        except BaseException:
-            msg = 'Parser error! Missing symbol ")"'
-            msg += " in line {}, column {}".format(19, 28)
-            raise Exception(msg)
-
-        return node, pos
+                    tree.add_token(node, pos, delimiter)
+            pos += 1
 
     def build(self, tokens):
         """
-        return ast
+        return ast as Tree
+
+        tokens may be a list, a TokenStream or a generator such as
+        Lexer.get_token(), which is then parsed while it is lexed.
 
         """
-        ast = list()
-        if tokens:
+        self.tree = tree = Tree(tokens)
+        self.tokens = tokens = TokenWindow(tokens)
+        root = 0
+
+        if not tokens.at_end(0):
             pos = 0
-            self.tokens = tokens
-            ast.append("program: ")
-            while pos < len(tokens):
-                if tokens[pos].value == "{":
-                    node, pos = self._node(pos + 1)
+            tree.text(root, "program: ")
+            while not tokens.at_end(pos):
+                tokens.release(pos)
+                if tokens[pos].tag == L_CURL:
+                    pos = self._node(pos + 1, tree.group(tree.group(root)))
                     pos += 1
-                    ast.append([node])
                 else:
                     if tokens[pos].tag == TYPE:
-                        pos_copy = pos
-                        if tokens[pos + 1].tag == FUNC_DECLARATION:
-                            node, pos = self._node(pos + 3)
-                            ast.append(
-                                [
-                                    "function declaration:",
-                                    tokens[pos_copy].value,
-                                    tokens[pos_copy + 1].value,
-                                    ["args:", "(", node, ")"],
-                                    "body:",
-                                ]
-                            )
+                        type_token, name_token = tokens[pos], tokens[pos + 1]
+                        if name_token.tag == FUNC_DECLARATION:
+                            function = tree.group(root)
+                            tree.text(function, "function declaration:")
+                            tree.add_token(function, pos, type_token)
+                            tree.add_token(function, pos + 1, name_token)
+                            args = tree.group(function)
+                            tree.text(args, "args:")
+                            tree.text(args, "(")
+                            pos = self._node(pos + 3, tree.group(args))
+                            tree.text(args, ")")
+                            tree.text(function, "body:")
                             pos += 1
                             continue
 
@@ -86,6 +349,7 @@ class Parser(object):
                     )
                     msg += " in line {}".format(tokens[pos].row)
                     raise Exception(msg)
-            ast.append("end program")
+            tree.text(root, "end program")
 
-        return ast
+        tree.compact()
+        return tree
@@ -337,6 +337,21 @@ def semantic_analysis(tree):
     print(functions)
 
 
+def semantic_stream(nodes):
+    """
+    Check function nodes while they are produced and yield every checked one,
+    initializations are checked after the last of them
+    :param nodes: iterable of Node - e.g. iter_functions(code)
+    :return: generator of Node
+    """
+
+    for node in nodes:
+        parse_tree(node)
+        yield node
+
+    check_inits()
+
+
 if __name__ == "__main__":
     tree = build_tree(data)
     semantic_analysis(tree)
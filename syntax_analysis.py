@@ -1,9 +1,29 @@
+import gc
+import hashlib
+import marshal
+import os
 import re
+import sys
+import threading
+from collections import ChainMap
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 
-from ply import yacc
+from ply import lex
 
 import lexical_analysis
+from ast_cache import ASTCache
 from lexical_analysis import tokens
+from parse_tables import load_parser
+
+TABLES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "parsetab.bin")
+CACHE_DIR = os.environ.get(
+    "MTRAN_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".ast_cache"),
+)
+# bumped whenever the layout of cache entries changes
+CACHE_FORMAT = 2
 
 data = """
 void reverseArray(int arr[], int start, int end)
@@ -76,6 +96,12 @@ class Node(object):
         return self
 
 
+precedence = (
+    ("left", "PLUSMINUS", "MOD"),
+    ("left", "DIVMUL"),
+)
+
+
 def p_program(p):
     """program :
     | function
@@ -204,10 +230,11 @@ def p_cond_sign(p):
     p[0] = p[1]
 
 
+# "int n = a / 2;" is an expr init like any other, the former
+# "ID DIVMUL NUMBER" alternative built init[int, n, "[]", "/", 2] for it
 def p_init(p):
     """init :
     | VARIABLE_TYPE ID
-    | VARIABLE_TYPE ID EQUAL ID DIVMUL NUMBER
     | VARIABLE_TYPE ID EQUAL expr
     | VARIABLE_TYPE ID EQUAL var_cal
     | VARIABLE_TYPE ID LCUADR RCUADR EQUAL array_init"""
@@ -269,12 +296,25 @@ def p_output_operator(p):
     p[0] = Node("output_operator", ["<<", p[3]])
 
 
+def p_expr_arg(p):
+    """expr : NUMBER
+    | STRING
+    | VARIABLE_TYPE ID
+    | VARIABLE_TYPE ID LCUADR RCUADR
+    | ID LCUADR RCUADR
+    | var_cal
+    | NUMBER ID
+    | func"""
+    p_arg(p)
+
+
 def p_expr(p):
-    """expr : fact
+    """expr : ID
     | PLUSMINUS PLUSMINUS
-    | expr PLUSMINUS fact
-    | expr MOD fact
-    | ID"""
+    | LPAR expr RPAR
+    | expr PLUSMINUS expr
+    | expr MOD expr
+    | expr DIVMUL expr"""
     if len(p) == 2:
         p[0] = p[1]
     elif len(p) == 3:
@@ -282,28 +322,12 @@ def p_expr(p):
             p[0] = Node("increment", ["++"])
         elif p[2] == "-":
             p[0] = Node("decrement", ["--"])
+    elif p[1] == "(":
+        p[0] = p[2]
     else:
         p[0] = Node(p[2], [p[1], p[3]])
 
 
-def p_fact(p):
-    """fact : term
-    | fact DIVMUL term"""
-    if len(p) == 2:
-        p[0] = p[1]
-    else:
-        p[0] = Node(p[2], [p[1], p[3]])
-
-
-def p_term(p):
-    """term : arg
-    | LPAR expr RPAR"""
-    if len(p) == 2:
-        p[0] = p[1]
-    else:
-        p[0] = p[2]
-
-
 def p_arg(p):
     """arg : NUMBER
     | STRING
@@ -323,9 +347,583 @@ def p_error(p):
     raise Exception("Unexpected token in line %d: %s" % (p.lineno, p))
 
 
-def build_tree(code):
-    parser = yacc.yacc()
-    return parser.parse(code)
+_parser = None
+_parser_lock = threading.Lock()
+
+
+def get_parser():
+    """
+    Build parser once per process from binary tables, without parser.out
+    :return: ply.yacc.LRParser
+    """
+
+    global _parser
+
+    with _parser_lock:
+        if _parser is None:
+            _parser = load_parser(sys.modules[__name__], TABLES)
+
+    return _parser
+
+
+_signature = None
+_cache = None
+
+
+def tree_signature():
+    """
+    Return hash of grammar, lexer rules, rule actions and cache entry
+    layout trees depend on
+    :return: str
+    """
+
+    global _signature
+
+    if _signature is None:
+        digest = hashlib.sha256(get_parser().signature.encode("utf-8"))
+        digest.update(lexical_analysis.rules_signature().encode("utf-8"))
+        digest.update(str(CACHE_FORMAT).encode("utf-8"))
+        for name, value in sorted(globals().items()):
+            if name[:2] == "p_" and callable(value):
+                digest.update(marshal.dumps(value.__code__))
+        _signature = digest.hexdigest()
+
+    return _signature
+
+
+def default_cache():
+    global _cache
+
+    if _cache is None:
+        _cache = ASTCache(CACHE_DIR)
+
+    return _cache
+
+
+def parse_code(code, workers=1):
+    """
+    Parse code with fresh lexers
+    :param code: str
+    :param workers: int
+    :return: (Node, list) - tree and diagnostics printed by the lexer
+    """
+
+    if workers == 1:
+        lexer = lexical_analysis.new_lexer()
+        return get_parser().parse(code, lexer=lexer), lexer.diagnostics
+
+    diagnostics = list()
+    return parse_parallel(code, workers, diagnostics=diagnostics), diagnostics
+
+
+def build_tree(code, lexer=None, cache=True, workers=1):
+    """
+    Parse code with a fresh lexer unless another one is given
+
+    Trees parsed with a fresh lexer are kept in an on-disk cache keyed by
+    code and tree_signature(), together with the lexer diagnostics, which
+    are printed again when the tree is taken from the cache.
+    :param code: str
+    :param lexer: ply.lex.Lexer - made by lexical_analysis.new_lexer()
+    :param cache: bool | ASTCache - False to always parse
+    :param workers: int - processes parsing functions, None for all cores
+    :return: Node
+    """
+
+    if lexer is not None:
+        return get_parser().parse(code, lexer=lexer)
+    elif not cache:
+        return parse_code(code, workers)[0]
+
+    cache = default_cache() if cache is True else cache
+    key = cache.key(code, tree_signature())
+    if (entry := cache.get(key)) is None:
+        tree, diagnostics = parse_code(code, workers)
+        cache.put(key, (tree, diagnostics))
+    else:
+        tree, diagnostics = entry
+        for message in diagnostics:
+            print(message)
+
+    return tree
+
+
+def parse_many(sources, cache=True):
+    """
+    Parse every source with the shared parser, trees are yielded one by
+    one and the first syntax error stops the batch
+    :param sources: iterable of str
+    :param cache: bool | ASTCache - as in build_tree
+    :return: generator of Node
+    """
+
+    for code in sources:
+        yield build_tree(code, cache=cache)
+
+
+# text up to the next character that may start a brace, a comment, a
+# string or an import, then whatever starts there
+SPAN_SCANNER = re.compile(
+    "[^{}/\"'#]*(?:(?P<hidden>%s)|(?P<brace>[{}])|.|$)"
+    % "|".join(
+        (
+            lexical_analysis.t_comment_ignore.__doc__,
+            lexical_analysis.t_ignore_imports.__doc__,
+            lexical_analysis.t_STRING,
+        )
+    ),
+    lexical_analysis.REFLAGS,
+)
+IDENTIFIER = re.compile(lexical_analysis.identifier)
+# guess of function declarations, IncrementalParser checks what it gives
+DECLARATION = re.compile(
+    r"\b(?:%s)\s+(%s)\("
+    % ("|".join(lexical_analysis.types), lexical_analysis.identifier)
+)
+
+
+def split_functions(code):
+    """
+    Return bounds of top-level function spans of code
+
+    A span ends with the brace closing its outermost block, text after the
+    last one belongs to the last span. Braces in comments and strings are
+    skipped the same way the lexer skips them. Lines are counted as the
+    lexer counts them, without newlines of comments, strings and imports.
+    :param code: str
+    :return: list of (int, int, int) - start, end and line of start
+    """
+
+    spans, start, depth, line, hidden = list(), 0, 0, 1, 0
+
+    for match in SPAN_SCANNER.finditer(code):
+        brace = match.group("brace")
+        if brace == "{":
+            depth += 1
+        elif brace == "}" and depth:
+            depth -= 1
+            if not depth:
+                spans.append((start, match.end(), line))
+                line += code.count("\n", start, match.end()) - hidden
+                start, hidden = match.end(), 0
+        elif brace is None and match.group("hidden") is not None:
+            hidden += match.group("hidden").count("\n")
+
+    if start < len(code) or not spans:
+        if spans and not code[start:].strip():
+            spans[-1] = (spans[-1][0], len(code), spans[-1][2])
+        else:
+            spans.append((start, len(code), line))
+
+    return spans
+
+
+def parse_span(code, start, end, line, declared, diagnostics=None, echo=True):
+    """
+    Parse one span of code
+
+    The lexer runs over the span of the whole code, so positions and lines
+    of tokens are the same as in a full parse.
+    :param code: str
+    :param start: int
+    :param end: int
+    :param line: int - line of start
+    :param declared: dict - reserved words and custom functions declared
+        before the span
+    :param diagnostics: list - gets the lexer diagnostics
+    :param echo: bool - print the lexer diagnostics
+    :return: (list of Node, dict) - functions and custom functions declared
+        by the span
+    """
+
+    lexer = lexical_analysis.new_lexer()
+    lexer.input(code)
+    lexer.lexpos, lexer.lexlen, lexer.lineno = start, end, line
+    lexer.reserved = ChainMap(dict(), declared)
+    lexer.echo = echo
+    if diagnostics is not None:
+        lexer.diagnostics = diagnostics
+
+    return get_parser().parse(lexer=lexer).parts, lexer.reserved.maps[0]
+
+
+def iter_functions(code):
+    """
+    Yield function nodes of code one by one, each as soon as it is parsed
+
+    Nothing holds the yielded nodes, so the consumer decides how many of
+    them stay in memory. Functions before a syntax error are yielded
+    before the error is raised.
+    :param code: str
+    :return: generator of Node
+    """
+
+    declared = dict(lexical_analysis.reserved)
+
+    for start, end, line in split_functions(code):
+        parts, names = parse_span(code, start, end, line, declared)
+        declared.update(names)
+        yield from parts
+
+
+def make_token(type, value, line, position):
+    token = lex.LexToken()
+    token.type, token.value, token.lineno, token.lexpos = type, value, line, position
+    return token
+
+
+class DeclaredBefore(Mapping):
+    """
+    Reserved words with custom functions declared by the first count
+    functions, as the lexer sees them in the body of the last of these
+
+    """
+
+    def __init__(self, order, count):
+        self.order = order
+        self.count = count
+
+    def __getitem__(self, name):
+        if self.order.get(name, self.count) < self.count:
+            return "CUSTOM_FUNC"
+
+        return lexical_analysis.reserved[name]
+
+    def __iter__(self):
+        yield from (name for name in self.order if self.order[name] < self.count)
+        yield from (
+            name
+            for name in lexical_analysis.reserved
+            if self.order.get(name, self.count) >= self.count
+        )
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
+class LazyFunction(Node):
+    """
+    Function node whose body is parsed on first access to body or parts
+
+    """
+
+    def __init__(self, header, code, start, end, line, declared, type_define):
+        self.type = "function"
+        self.header = header
+        self._body = None
+        self._span = (code, start, end, line, declared, type_define)
+
+    @property
+    def body(self):
+        if self._body is None:
+            code, start, end, line, declared, type_define = self._span
+
+            lexer = lexical_analysis.new_lexer()
+            lexer.input(code)
+            lexer.lexpos, lexer.lexlen, lexer.lineno = start, end, line
+            lexer.reserved = ChainMap(dict(), declared)
+            lexer.type_define = type_define
+
+            # a header without arguments before the body tokens
+            tokens = chain(
+                (
+                    make_token(type, value, line, start)
+                    for type, value in (
+                        ("VARIABLE_TYPE", "void"),
+                        ("FUNCDECL", self.header.parts[1]),
+                        ("LPAR", "("),
+                        ("RPAR", ")"),
+                    )
+                ),
+                iter(lexer.token, None),
+            )
+
+            tree = get_parser().parse(lexer=lexer, tokenfunc=lambda: next(tokens, None))
+            self._body, self._span = tree.parts[0].parts[1], None
+
+        return self._body
+
+    @property
+    def parts(self):
+        return [self.header, self.body]
+
+    @property
+    def parsed(self):
+        return self._body is not None
+
+
+def preparse(code):
+    """
+    Return program tree of code with bodies of functions left unparsed
+
+    Headers of all functions are parsed at once, each followed by an empty
+    block in place of its body. Bodies are skipped by the brace matching of
+    split_functions and parsed when somebody asks for them, syntax errors
+    of a body are raised at that moment.
+    :param code: str
+    :return: Node - program of LazyFunction nodes
+    """
+
+    lexer = lexical_analysis.new_lexer()
+    lexer.input(code)
+    order, bodies = dict(), list()
+
+    def header_tokens():
+        for start, end, line in split_functions(code):
+            body = next(
+                (
+                    match.end() - 1
+                    for match in SPAN_SCANNER.finditer(code, start, end)
+                    if match.group("brace") == "{"
+                ),
+                None,
+            )
+
+            lexer.lexpos, lexer.lexlen = start, end if body is None else body
+            lexer.lineno = line
+            lexer.type_define = False
+            for token in iter(lexer.token, None):
+                if token.type == "FUNCDECL":
+                    order.setdefault(token.value, len(bodies))
+                yield token
+
+            if body is not None:
+                bodies.append((body, end, lexer.lineno, lexer.type_define))
+                yield make_token("LCURL", "{", lexer.lineno, body)
+                yield make_token("RCURL", "}", lexer.lineno, body + 1)
+
+    tokens = header_tokens()
+    tree = get_parser().parse(lexer=lexer, tokenfunc=lambda: next(tokens, None))
+
+    return Node(
+        "program",
+        [
+            LazyFunction(
+                function.parts[0],
+                code,
+                *bodies[number][:3],
+                DeclaredBefore(order, number + 1),
+                bodies[number][3],
+            )
+            for number, function in enumerate(tree.parts)
+        ],
+    )
+
+
+class FunctionSpan(object):
+    """
+    Parsed span with everything needed to tell whether it can be reused
+
+    """
+
+    __slots__ = ("identifiers", "used", "declared", "parts", "line", "diagnostics")
+
+    def __init__(self, identifiers, used, declared, parts, line, diagnostics):
+        self.identifiers = identifiers
+        self.used = used
+        self.declared = declared
+        self.parts = parts
+        self.line = line
+        self.diagnostics = diagnostics
+
+
+class IncrementalParser(object):
+    """
+    Parser reusing function subtrees of the previous parse
+
+    Source is split into top-level function spans and only the spans whose
+    text changed are parsed again. A span is also parsed again when a name
+    inside it is declared before it with another token type, because the
+    lexer tags custom functions as CUSTOM_FUNC, even those shadowing
+    reserved words.
+
+    Lexer diagnostics are kept with their spans and gathered in diagnostics,
+    in source order, by every parse, and printed unless echo is off. They
+    hold line numbers, so a span with diagnostics is reused only with echo
+    off and when it starts on the same line.
+
+    """
+
+    def __init__(self, echo=True):
+        self.spans = dict()
+        self.parsed = 0
+        self.reused = 0
+        self.echo = echo
+        self.diagnostics = list()
+
+    @staticmethod
+    def used(identifiers, declared):
+        return frozenset(
+            (name, declared[name]) for name in identifiers if name in declared
+        )
+
+    def parse_span(self, code, start, end, line, declared):
+        diagnostics = list()
+        try:
+            parts, names = parse_span(
+                code, start, end, line, declared, diagnostics, self.echo
+            )
+        finally:
+            self.diagnostics.extend(diagnostics)
+
+        identifiers = frozenset(IDENTIFIER.findall(code, start, end))
+        return FunctionSpan(
+            identifiers,
+            self.used(identifiers, declared),
+            list(names.items()),
+            parts,
+            line,
+            diagnostics,
+        )
+
+    def parse(self, code):
+        """
+        Return program tree of code, only changed functions are parsed
+        :param code: str
+        :return: Node
+        """
+
+        spans, parts = dict(), list()
+        declared = dict(lexical_analysis.reserved)
+        self.parsed = self.reused = 0
+        self.diagnostics = list()
+
+        for start, end, line in split_functions(code):
+            text = code[start:end].encode("utf-8", "surrogatepass")
+            digest = hashlib.blake2b(text).digest()
+
+            span = spans.get(digest) or self.spans.get(digest)
+            if (
+                span is None
+                or span.used != self.used(span.identifiers, declared)
+                or (span.diagnostics and (self.echo or span.line != line))
+            ):
+                span = self.parse_span(code, start, end, line, declared)
+                self.parsed += 1
+            else:
+                self.reused += 1
+                self.diagnostics.extend(span.diagnostics)
+
+            spans[digest] = span
+            parts.extend(span.parts)
+            declared.update(span.declared)
+
+        self.spans = spans
+        return Node("program", parts)
+
+
+_pool = None
+_pool_workers = None
+_pool_lock = threading.Lock()
+
+
+def get_pool(workers):
+    """
+    Return process pool whose workers build their parser on start
+    :param workers: int
+    :return: ProcessPoolExecutor
+    """
+
+    global _pool, _pool_workers
+
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown()
+            _pool = ProcessPoolExecutor(workers, initializer=get_parser)
+            _pool_workers = workers
+
+    return _pool
+
+
+def parse_spans(code, spans, declared):
+    """
+    Parse spans of code in a worker, None stands for spans after an error
+    :param code: str - text of the spans
+    :param spans: list of (int, int, int) - as given by split_functions
+    :param declared: dict - reserved words and custom functions guessed to
+        be declared before
+    :return: list of FunctionSpan
+    """
+
+    parser, parsed = IncrementalParser(echo=False), list()
+
+    for start, end, line in spans:
+        try:
+            span = parser.parse_span(code, start, end, line, declared)
+        except Exception:
+            break
+
+        parsed.append(span)
+        declared.update(span.declared)
+
+    return parsed + [None] * (len(spans) - len(parsed))
+
+
+def parse_parallel(code, workers=None, chunks=None, diagnostics=None):
+    """
+    Parse top-level functions of code in a process pool
+
+    Every chunk of functions is parsed by a worker with custom functions of
+    the chunks before it guessed by DECLARATION. The subtrees are merged by
+    IncrementalParser in source order, which parses again every function
+    that failed or lexed a declared name with another token type than the
+    serial parse gives it, as when the guess misses a declaration shadowing
+    a reserved word, so the tree and errors are the same as those of a
+    serial parse. Workers print nothing, diagnostics
+    of the functions kept in the tree are printed by this process in source
+    order once merging ends, before its error if any.
+    :param code: str
+    :param workers: int - os.cpu_count() by default
+    :param chunks: int - pieces of work, four per worker by default
+    :param diagnostics: list - extended with the printed diagnostics
+    :return: Node
+    """
+
+    workers = workers or os.cpu_count() or 1
+    spans = split_functions(code)
+    size = -(-len(spans) // (chunks or workers * 4))
+    batches = [spans[index : index + size] for index in range(0, len(spans), size)]
+
+    jobs, declared = list(), dict(lexical_analysis.reserved)
+    for batch in batches:
+        start, end = batch[0][0], batch[-1][1]
+        jobs.append(
+            (
+                code[start:end],
+                [(first - start, last - start, line) for first, last, line in batch],
+                dict(declared),
+            )
+        )
+        declared.update(
+            (name, "CUSTOM_FUNC") for name in DECLARATION.findall(code, start, end)
+        )
+
+    parser = IncrementalParser(echo=False)
+    results = get_pool(workers).map(parse_spans, *zip(*jobs))
+
+    # subtrees of workers hold no cycles, collecting them while they are
+    # unpickled only costs time; the switch is process-wide, so it covers
+    # nothing but the unpickling
+    collect = gc.isenabled()
+    gc.disable()
+    try:
+        for batch, parsed in zip(batches, results):
+            for (start, end, _), span in zip(batch, parsed):
+                if span is not None:
+                    text = code[start:end].encode("utf-8", "surrogatepass")
+                    parser.spans[hashlib.blake2b(text).digest()] = span
+    finally:
+        if collect:
+            gc.enable()
+
+    try:
+        return parser.parse(code)
+    finally:
+        for message in parser.diagnostics:
+            print(message)
+        if diagnostics is not None:
+            diagnostics.extend(parser.diagnostics)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,116 @@
+"""
+Streaming reports of token tables
+
+Rows are written to the output as soon as they are produced, nothing but
+a small sample of them is kept in memory. Text tables look like the ones
+drawn by texttable, their column widths are computed from the first rows
+and only grow for the row holding a longer cell.
+
+"""
+
+import csv
+import json
+import sys
+from itertools import chain, islice
+
+FORMATS = ("text", "csv", "tsv", "jsonl")
+SAMPLE_SIZE = 1000
+
+
+def cell_lines(cell):
+    return str(cell).split("\n")
+
+
+def text_border(widths, fill="-"):
+    return "+" + "+".join(fill * (width + 2) for width in widths) + "+\n"
+
+
+def text_row(cells, widths, center=False):
+    """
+    Return table row, cells with several lines take several lines of text
+    :param cells: list - lines of every cell
+    :param widths: list
+    :param center: bool - center cells instead of aligning them left
+    :return: str
+    """
+
+    height = max(map(len, cells))
+    lines = list()
+
+    for number in range(height):
+        parts = list()
+        for lines_of_cell, width in zip(cells, widths):
+            line = lines_of_cell[number] if number < len(lines_of_cell) else ""
+            parts.append(line.center(width) if center else line.ljust(width))
+
+        lines.append("| " + " | ".join(parts) + " |\n")
+
+    return "".join(lines)
+
+
+def write_text(rows, headings, output, sample=SAMPLE_SIZE):
+    """
+    Write rows as text table with header
+    :param rows: iterator of tuples
+    :param headings: list
+    :param output: file
+    :param sample: int - rows used to compute column widths
+    """
+
+    head = [list(map(cell_lines, row)) for row in islice(rows, sample)]
+    widths = [len(heading) for heading in headings]
+
+    for cells in head:
+        for column, lines in enumerate(cells):
+            widths[column] = max(widths[column], *map(len, lines))
+
+    border = text_border(widths)
+    output.write(border)
+    output.write(text_row([[heading] for heading in headings], widths, True))
+    output.write(text_border(widths, "="))
+
+    for cells in chain(head, (list(map(cell_lines, row)) for row in rows)):
+        output.write(text_row(cells, widths))
+        output.write(border)
+
+
+def write_csv(rows, headings, output, delimiter=","):
+    writer = csv.writer(output, delimiter=delimiter, lineterminator="\n")
+    writer.writerow(headings)
+
+    for row in rows:
+        writer.writerow(row)
+
+
+def write_jsonl(rows, fields, output):
+    for row in rows:
+        output.write(json.dumps(dict(zip(fields, row)), ensure_ascii=False))
+        output.write("\n")
+
+
+def write_report(rows, headings, output=None, fmt="text", fields=None):
+    """
+    Write rows to output in one of FORMATS while they are produced
+    :param rows: iterable of tuples
+    :param headings: list - column titles of text, CSV and TSV reports
+    :param output: file - sys.stdout by default
+    :param fmt: str - "text", "csv", "tsv" or "jsonl"
+    :param fields: list - keys of JSONL objects, lowercase headings by default
+    """
+
+    output = sys.stdout if output is None else output
+    rows = iter(rows)
+
+    if fmt == "text":
+        write_text(rows, headings, output)
+    elif fmt == "csv":
+        write_csv(rows, headings, output)
+    elif fmt == "tsv":
+        write_csv(rows, headings, output, "\t")
+    elif fmt == "jsonl":
+        if fields is None:
+            fields = [heading.lower() for heading in headings]
+
+        write_jsonl(rows, fields, output)
+    else:
+        raise ValueError("Unknown report format: %s" % fmt)